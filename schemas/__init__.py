@@ -0,0 +1,60 @@
+"""
+Stage 1 page schemas.
+
+Each stage1_page*.py module defines one schema variant and exposes its
+Stage1PageModel; variants are referred to by module name (e.g.
+'stage1_page_v2_small'), as in the extraction output paths.
+"""
+import importlib
+import json
+from functools import lru_cache
+from typing import Any, Dict
+
+# Variant modules, imported on first attribute access (PEP 562) so that
+# `import schemas` only builds the models that are actually used
+VARIANTS = (
+    "stage1_page",
+    "stage1_page_v2",
+    "stage1_page_v2_pure",
+    "stage1_page_v2_medium",
+    "stage1_page_v2_medium_pure",
+    "stage1_page_v2_small",
+    "stage1_page_v2_small_pure",
+)
+
+
+def __getattr__(name):
+    if name not in VARIANTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # import_module binds the submodule on the package, so this runs once
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(VARIANTS))
+
+
+@lru_cache(maxsize=None)
+def get_schema(variant: str) -> Dict[str, Any]:
+    """
+    JSON schema of a variant's Stage1PageModel, built once per variant.
+
+    The returned dict is shared between callers: do not mutate it
+    (use copy.deepcopy first if it needs editing).
+
+    Args:
+        variant: Schema module name (e.g., 'stage1_page_v2_small')
+
+    Returns:
+        JSON schema dict, as produced by model_json_schema()
+    """
+    module = importlib.import_module(f".{variant}", __name__)
+    return module.Stage1PageModel.model_json_schema()
+
+
+@lru_cache(maxsize=None)
+def get_schema_bytes(variant: str) -> bytes:
+    """
+    Compact UTF-8 JSON encoding of get_schema(variant).
+    """
+    return json.dumps(get_schema(variant), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,332 @@
+"""
+Field descriptions shared by the Stage 1 page schemas.
+
+The descriptions are part of the prompt: they are exported in the JSON
+schema sent to the model, so any edit here changes every schema that
+references the constant.
+"""
+from typing import Dict
+
+
+# Item fields - common to v1 and v2
+
+ITEM_TITLE_DESC = (
+    "Title or heading of the contribution, if printed.\n"
+    "Extract even if displayed in decorative, display, or non-standard font.\n"
+    "Transcribe exactly as printed.\n"
+    "Set to null if no title is present.\n"
+    "Note: Title should also appear in item_text_raw."
+)
+
+IS_CONTINUATION_DESC = (
+    "Indicates whether this item continues from the previous page.\n\n"
+    "Set to true if evidence strongly suggests this is a continuation:\n"
+    "- Text starts with lowercase letter (mid-sentence)\n"
+    "- No title present when one would be expected for this item type\n"
+    "- Text clearly begins mid-paragraph or mid-thought\n\n"
+    "Omit this field entirely if the item does NOT continue from previous page. "
+    "Evidence suggests that the text starts a new contribution and it's not a continuation:\n"
+    "- Text starts with capital letter and appears to be beginning of sentence\n"
+    "- Title is present\n"
+    "- Content appears self-contained\n\n"
+    "Note: An item can be BOTH a continuation from previous page AND continue to next page. "
+    "In this case, both is_continuation and continues_on_next_page will be true.\n\n"
+    "Never set to false - absence of field indicates no continuation."
+)
+
+CONTINUES_ON_NEXT_PAGE_DESC = (
+    "Indicates whether this item continues to the next page.\n\n"
+    "Set to true if evidence strongly suggests continuation follows:\n"
+    "- Text ends mid-sentence with no closing punctuation\n"
+    "- No author attribution at the end when expected for this item type\n"
+    "- Narrative or argument clearly incomplete\n\n"
+    "Evidence that suggests the contribution is complete and doesn't continue in the next page:\n"
+    "- Text ends with closing punctuation (period, exclamation, question mark)\n"
+    "- Author attribution present at end\n"
+    "- Content appears complete (story ends, poem concludes, article reaches conclusion)\n\n"
+    "Omit this field entirely if the item does NOT continue to next page. "
+    "Note: An item can be BOTH a continuation from previous page AND continue to next page. "
+    "In this case, both is_continuation and continues_on_next_page will be true.\n\n"
+    "Never set to false - absence of field indicates no continuation."
+)
+
+# Item fields - v1
+
+ITEM_CLASS_DESC_V1 = (
+    "Classification of the text block's content type:\n"
+    "- 'prose': Continuous prose text (articles, essays, short stories, reviews, "
+    "literary criticism, chronicles). Characterized by paragraph structure.\n"
+    "- 'verse': Poetry with line breaks and potential stanza structure. "
+    "Includes both measured and free verse.\n"
+    "- 'ad': Advertisements and commercial content. Book announcements, "
+    "publisher advertisements, commercial announcements.\n"
+    "- 'paratext': Editorial framing and metadata including:\n"
+    "  * Magazine title/masthead (e.g., 'LA PLUME') - extract as item even if in mag_title field\n"
+    "  * Issue numbers, dates, page numbers - extract even if in other fields\n"
+    "  * Section headers, table of contents\n"
+    "  * Running headers/footers\n"
+    "  * Printer information, editor/manager names\n"
+    "  * Subscription notices, pricing for magazine itself\n"
+    "  * Portrait/illustration announcements\n"
+    "- 'unknown': Classification uncertain. Use only when genuinely ambiguous. "
+    "Prefer specific classifications when possible.\n\n"
+    "Classification is based on content nature, not structural position on page."
+)
+
+ITEM_TEXT_RAW_DESC_V1 = (
+    "Complete text of this block exactly as printed.\n\n"
+    "COMPLETENESS:\n"
+    "Include ALL elements: title, subtitles, body text, author (beginning OR end), "
+    "continuation markers (e.g., '(Suite)', '(À Suivre.)'), source attributions.\n\n"
+    "CRITICAL - LINE BREAKS:\n"
+    "For PROSE (articles, stories, essays):\n"
+    "- Use \\n\\n ONLY for paragraph breaks (blank line or first-line indent in original)\n"
+    "- DO NOT use \\n for visual line wraps in the printed layout\n"
+    "- A continuous paragraph must be continuous text without line breaks\n"
+    "- Common error: Adding \\n at every line wrap. DON'T DO THIS.\n"
+    "- Exception: Use \\n for distinct visual elements like 'NUMÉRO 10\\n1er SEPTEMBRE 1889'\n\n"
+    "For VERSE (poetry):\n"
+    "- Preserve ALL line breaks exactly as printed\n"
+    "- Each verse line = one line with \\n\n"
+    "- Stanza breaks = \\n\\n\n"
+    "- CRITICAL: If a verse line is too long and wraps to next line (often right-aligned), "
+    "this is STILL THE SAME VERSE LINE. Join them without \\n. "
+    "HYPHENATION:\n"
+    "- REMOVE layout hyphens: 'extraordi-\\naire' becomes 'extraordinaire'\n"
+    "- KEEP real hyphens: 'peut-être', 'vis-à-vis', 'celle-ci'\n"
+    "- Common error: Keeping 'devant les-\\nquelles' instead of 'devant lesquelles'. "
+    "Remove the hyphen AND join the words.\n\n"
+    "ORTHOGRAPHY:\n"
+    "- Preserve capitalization exactly (note: 19th century capitals often lack accents: 'A cette époque')\n"
+    "- Preserve ALL accents as printed: è é ê à ù etc.\n"
+    "- Preserve ligatures: œ, æ\n"
+    '- Preserve quotation marks: « » or " as printed\n'
+    "- Preserve '&' if present\n"
+    "- Preserve spacing around punctuation AS PRINTED (inconsistent in originals)"
+)
+
+ITEM_AUTHOR_DESC_V1 = (
+    "Author name(s) attributed to this contribution, if printed.\n\n"
+    "CRITICAL: Author may appear at BEGINNING or END of text. "
+    "Check BOTH locations. Most commonly, authors appear at the END.\n\n"
+    "Common error: Missing author because it's at the end after the text. "
+    "Always check the last line.\n\n"
+    "Format preservation:\n"
+    "- Transcribe exactly as printed\n"
+    "- Multiple authors: 'Edmond et Jules de Goncourt'\n"
+    "- Name variations: 'Jules Laforgue', 'J. Laforgue', 'Laforgue'\n"
+    "Note: Author must also appear in item_text_raw."
+)
+
+# Item fields - v2
+
+ITEM_CLASS_DESC_V2 = (
+    "Classification of the text block's content type:\n"
+    "- 'prose': Continuous prose text (articles, essays, short stories, reviews, "
+    "literary criticism, chronicles). Characterized by paragraph structure.\n"
+    "- 'verse': Poetry with line breaks and potential stanza structure. "
+    "Includes both measured and free verse.\n"
+    "- 'ad': Advertisements and commercial content. Book announcements, "
+    "publisher advertisements, commercial announcements.\n"
+    "- 'paratext': Editorial framing and metadata. CREATE A SEPARATE ITEM for each distinct paratextual element:\n"
+    "  * Magazine title/masthead → separate item (even if in mag_title field)\n"
+    "  * Issue number → separate item (even if in issue_label field)\n"
+    "  * Date → separate item (even if in date_string field)\n"
+    "  * Page number → separate item (even if in page_ref field)\n"
+    "  * Section header → separate item\n"
+    "  * Running header/footer → separate item\n"
+    "  * Printer information → separate item\n"
+    "  * Subscription notice → separate item\n"
+    "  * Portrait/illustration announcement → separate item\n"
+    "  Even if these elements appear close together visually, extract each as its own item.\n"
+    "- 'unknown': Classification uncertain. Use only when genuinely ambiguous. "
+    "Prefer specific classifications when possible.\n\n"
+    "Classification is based on content nature, not structural position on page."
+)
+
+ITEM_TEXT_RAW_DESC_V2 = (
+    "Complete text of this block exactly as printed.\n\n"
+    "CRITICAL RULES (MOST IMPORTANT):\n"
+    "1. Multi-column text: If this contribution spans multiple columns, include ALL text from all columns in this single item\n"
+    "2. Paragraph breaks in prose: Use \\n\\n ONLY for actual paragraph breaks (blank line or indent), NOT for visual line wraps\n"
+    "3. Hyphenation: REMOVE layout hyphens (extraordi-naire → extraordinaire), KEEP real hyphens (peut-être, vis-à-vis)\n\n"
+    "FORMAT BY CONTENT TYPE:\n"
+    "For PROSE (articles, stories, essays):\n"
+    "- Use \\n\\n only for paragraph breaks\n"
+    "- Do NOT use \\n for line wraps in printed layout\n"
+    "- Exception: Use \\n for distinct visual elements ('NUMÉRO 10\\n1er SEPTEMBRE 1889')\n\n"
+    "For VERSE (poetry):\n"
+    "- Preserve ALL line breaks exactly: each verse line = one \\n\n"
+    "- Stanza breaks = \\n\\n\n"
+    "- CRITICAL: If a verse line wraps to next line (often right-aligned), it's STILL ONE line - join without \\n\n\n"
+    "PRESERVE EXACTLY AS PRINTED:\n"
+    "- 19th century orthography: capitals often lack accents ('A cette époque' not 'À cette époque')\n"
+    "- All accents: è é ê à ù\n"
+    "- Ligatures: œ æ\n"
+    '- Quotation marks: « » or " as printed\n'
+    "- Ampersands: &\n"
+    "- Spacing around punctuation (inconsistent in originals, preserve as-is)\n\n"
+    "INCLUDE ALL ELEMENTS:\n"
+    "- Title, subtitles, body text\n"
+    "- Author (check beginning AND end of text - most commonly at END)\n"
+    "- Continuation markers ('Suite', 'À Suivre')\n"
+    "- Source attributions"
+)
+
+ITEM_AUTHOR_DESC_V2 = (
+    "Author name(s) if printed. CRITICAL: Check BOTH beginning and end of text - authors most commonly appear at the END.\n\n"
+    "Transcribe exactly as printed. Examples: 'Edmond et Jules de Goncourt', 'Jules Laforgue', 'J. Laforgue'.\n\n"
+    "Note: Author must also appear in item_text_raw."
+)
+
+# Page fields - common to v1 and v2
+
+MAG_TITLE_DESC = (
+    "Magazine title as printed on this specific page. "
+    "Transcribe exactly as it appears, even if stylized or in decorative font. "
+    "Usually found in masthead, running header, or decorative logo. "
+    "Set to null if not visible on this page."
+)
+
+ISSUE_LABEL_DESC = (
+    "Issue number or label as printed on the page. "
+    "Preserve original formatting and language. "
+    "May include year, volume, or series information. "
+    "Examples: 'N° 10', 'Première année', 'Tome II, N° 5'. "
+    "Set to null if not present on this page."
+)
+
+DATE_STRING_DESC = (
+    "Publication date as printed on this page. "
+    "Preserve original formatting - do not standardize or modernize. "
+    "Keep period-appropriate orthography. "
+    "Examples: 'Juin 89.', '1er Septembre 1889', '15 juin 1890'. "
+    "Set to null if not present on this page."
+)
+
+PAGE_REF_DESC = (
+    "Page number as printed on this page. "
+    "Transcribe exactly as formatted. "
+    "Examples: '100', 'p. 45', '- 23 -'. "
+    "Set to null if not present."
+)
+
+# Page fields - versioned
+
+ITEMS_DESC_V1 = (
+    "Ordered list of ALL text blocks appearing on the page.\n\n"
+    "CRITICAL: Extract EVERY piece of text visible on the page as a separate item. "
+    "This includes:\n"
+    "- Magazine masthead and title (even if already in mag_title field)\n"
+    "- Issue information, dates, page numbers (even if in other fields)\n"
+    "- Literary contributions (prose, verse)\n"
+    "- Advertisements and announcements\n"
+    "- Editorial content and notes\n"
+    "- Printer information\n"
+    "- Subscription forms\n"
+    "- Running headers/footers\n"
+    "- Section titles\n\n"
+    "READING ORDER RULES:\n"
+    "1. Direction: Top to bottom, left to right.\n"
+    "2. Multi-column layouts: Complete left column entirely, then right column.\n"
+    "3. CRITICAL - Column-spanning contributions: When a SINGLE contribution spans multiple columns, "
+    "treat it as ONE item. Combine text from left column + right column in item_text_raw. "
+    "DO NOT create separate items for each column of the same contribution. "
+    "Common error: Splitting one poem/article into two items because of column break. DON'T DO THIS.\n"
+    "4. Missing text: If text continues in a second column, you MUST include it. "
+    "Do not omit the second half of contributions.\n"
+    "5. Natural reading: Follow the sequence a reader would naturally follow.\n\n"
+    "Empty pages: For blank pages, items may be empty list []."
+)
+
+ITEMS_DESC_V2 = (
+    "Ordered list of ALL text blocks appearing on the page.\n\n"
+    "READING ORDER & EXTRACTION RULES:\n"
+    "1. CRITICAL - Column-spanning: If a single contribution spans multiple columns, treat it as ONE item. Combine all text from all columns in item_text_raw. Do NOT split one contribution into multiple items.\n"
+    "2. Extract in natural reading order: top-to-bottom, left-to-right\n"
+    "3. Multi-column layouts: Complete left column, then right column\n"
+    "4. Include ALL text: Don't omit text that continues in additional columns\n\n"
+    "EXTRACT EVERY piece of text visible on the page as a separate item:\n"
+    "- Magazine masthead and title (even if in mag_title field)\n"
+    "- Issue information, dates, page numbers (even if in other fields)\n"
+    "- Literary contributions (prose, verse)\n"
+    "- Advertisements and announcements\n"
+    "- Editorial content and notes\n"
+    "- Printer information\n"
+    "- Subscription forms\n"
+    "- Running headers/footers\n"
+    "- Section titles\n\n"
+    "Empty pages: items may be empty list []."
+)
+
+
+# v2 family: descriptions per variant size, then per field. The full
+# variant reuses the constants above; medium and small are condensed
+# rewrites shared by each size's with/without-continuation schemas.
+V2_DESCRIPTIONS: Dict[str, Dict[str, str]] = {
+    "full": {
+        "item_class": ITEM_CLASS_DESC_V2,
+        "item_text_raw": ITEM_TEXT_RAW_DESC_V2,
+        "item_title": ITEM_TITLE_DESC,
+        "item_author": ITEM_AUTHOR_DESC_V2,
+        "is_continuation": IS_CONTINUATION_DESC,
+        "continues_on_next_page": CONTINUES_ON_NEXT_PAGE_DESC,
+        "mag_title": MAG_TITLE_DESC,
+        "issue_label": ISSUE_LABEL_DESC,
+        "date_string": DATE_STRING_DESC,
+        "page_ref": PAGE_REF_DESC,
+        "items": ITEMS_DESC_V2,
+    },
+    "medium": {
+        "item_class": (
+            "Classification of the text block: 'prose' for articles/stories/essays with paragraph structure, "
+            "'verse' for poetry with line breaks, 'ad' for advertisements and commercial content, "
+            "'paratext' for editorial framing (magazine title, issue number, date, page number, section headers, "
+            "running headers/footers, printer info, subscription notices - CREATE A SEPARATE ITEM for each distinct element), "
+            "or 'unknown' if genuinely ambiguous."
+        ),
+        "item_text_raw": (
+            "Complete text exactly as printed. If this contribution spans multiple columns, include ALL text from all columns in this single item. "
+            "For prose, use \\n\\n only for paragraph breaks, not for visual line wraps. For verse, preserve all line breaks exactly. "
+            "Remove layout hyphens (extraordi-naire → extraordinaire) but keep real hyphens (peut-être). "
+            "Preserve 19th century orthography (capitals without accents), all accents, ligatures, and spacing as printed. "
+            "Include all elements: title, body, author (check end of text - authors commonly appear there), continuation markers, attributions."
+        ),
+        "item_title": "Title or heading of the contribution if printed, transcribed exactly. Set to null if absent.",
+        "item_author": (
+            "Author name(s) if printed - check both beginning AND end of text (authors most commonly at end). "
+            "Transcribe exactly as printed."
+        ),
+        "is_continuation": (
+            "Set to true if this item continues from the previous page (starts lowercase/mid-sentence, no title when expected, mid-paragraph). "
+            "Omit field entirely if not a continuation - never set to false."
+        ),
+        "continues_on_next_page": (
+            "Set to true if this item continues to the next page (ends mid-sentence, no closing punctuation, no author at end when expected, incomplete narrative). "
+            "Omit field entirely if item is complete - never set to false."
+        ),
+        "mag_title": "Magazine title as printed on this page, transcribed exactly. Set to null if not visible.",
+        "issue_label": "Issue number or label as printed, preserving original formatting. Set to null if absent.",
+        "date_string": "Publication date as printed, preserving original formatting. Set to null if absent.",
+        "page_ref": "Page number as printed, transcribed exactly. Set to null if absent.",
+        "items": (
+            "Ordered list of all text blocks on the page in reading order (top-to-bottom, left-to-right). "
+            "CRITICAL: If a single contribution spans multiple columns, treat it as ONE item - combine all text in item_text_raw, don't split into separate items. "
+            "Extract every piece of visible text including magazine masthead, issue info, dates, page numbers, literary contributions, ads, editorial content, printer info, subscription forms, headers/footers, section titles. "
+            "Empty pages may have empty list."
+        ),
+    },
+    "small": {
+        "item_class": "Content type: prose, verse, ad, paratext, or unknown",
+        "item_text_raw": "Complete text as printed, preserving formatting and orthography",
+        "item_title": "Title or heading if printed",
+        "item_author": "Author name if printed",
+        "is_continuation": "True if item continues from previous page",
+        "continues_on_next_page": "True if item continues to next page",
+        "mag_title": "Magazine title as printed",
+        "issue_label": "Issue number or label",
+        "date_string": "Publication date as printed",
+        "page_ref": "Page number",
+        "items": "All text blocks in reading order",
+    },
+}
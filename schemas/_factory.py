@@ -0,0 +1,104 @@
+"""
+Factory for the Stage 1 v2 page schemas.
+
+The v2 variants (full, medium and small descriptions, each with or without
+continuation fields) share one shape and differ only in their field
+descriptions and in the two continuation fields. Each combination is built
+once with create_model and cached; the stage1_page_v2*.py modules are thin
+shims that expose the resulting Stage1Item and Stage1PageModel.
+"""
+from functools import lru_cache
+from typing import List, Literal, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+from ._descriptions import V2_DESCRIPTIONS
+
+
+# Item classification vocabulary
+ITEM_CLASS = Literal["prose", "verse", "ad", "paratext", "unknown"]
+
+# Description length of a variant: full (v2), medium or small
+SchemaSize = Literal["full", "medium", "small"]
+
+_ITEM_DOC = """
+    A discrete text block on the page (contribution, advertisement, or paratextual element).
+    """
+
+_PAGE_DOC = """
+    Complete page-level extraction from a historical magazine page.
+    Includes page metadata and all text items in reading order.
+    """
+
+# Validated instances are read-only, as for the v1 models; unknown keys are
+# dropped rather than rejected so extra keys from a model do not fail a page
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+# Module each variant is exposed from, so the classes pickle and repr
+# under their public import path
+_SIZE_SUFFIX = {"full": "", "medium": "_medium", "small": "_small"}
+
+
+def _module_name(size: SchemaSize, with_continuation: bool) -> str:
+    suffix = _SIZE_SUFFIX[size] + ("" if with_continuation else "_pure")
+    return f"{__package__}.stage1_page_v2{suffix}"
+
+
+@lru_cache(maxsize=None)
+def build_models(
+    size: SchemaSize,
+    with_continuation: bool
+) -> Tuple[Type[BaseModel], Type[BaseModel]]:
+    """
+    Build (or return the cached) item and page models for a v2 variant.
+
+    The continuation variant derives its item model (and its frozen
+    config) from the pure one, so the four content fields are declared
+    once per size.
+
+    Args:
+        size: Description variant ('full', 'medium' or 'small')
+        with_continuation: Whether items carry is_continuation and
+            continues_on_next_page
+
+    Returns:
+        Tuple of (Stage1Item, Stage1PageModel) classes
+    """
+    desc = V2_DESCRIPTIONS[size]
+    module = _module_name(size, with_continuation)
+
+    if with_continuation:
+        base_item, _ = build_models(size, with_continuation=False)
+        item_model = create_model(
+            "Stage1Item",
+            __base__=base_item,
+            __doc__=_ITEM_DOC,
+            __module__=module,
+            is_continuation=(Optional[bool], Field(None, description=desc["is_continuation"])),
+            continues_on_next_page=(Optional[bool], Field(None, description=desc["continues_on_next_page"])),
+        )
+    else:
+        item_model = create_model(
+            "Stage1Item",
+            __config__=_MODEL_CONFIG,
+            __doc__=_ITEM_DOC,
+            __module__=module,
+            item_class=(ITEM_CLASS, Field(..., description=desc["item_class"])),
+            item_text_raw=(str, Field(..., description=desc["item_text_raw"])),
+            item_title=(Optional[str], Field(None, description=desc["item_title"])),
+            item_author=(Optional[str], Field(None, description=desc["item_author"])),
+        )
+
+    page_model = create_model(
+        "Stage1PageModel",
+        __config__=_MODEL_CONFIG,
+        __doc__=_PAGE_DOC,
+        __module__=module,
+        mag_title=(Optional[str], Field(None, description=desc["mag_title"])),
+        issue_label=(Optional[str], Field(None, description=desc["issue_label"])),
+        date_string=(Optional[str], Field(None, description=desc["date_string"])),
+        page_ref=(Optional[str], Field(None, description=desc["page_ref"])),
+        items=(List[item_model], Field(..., description=desc["items"])),
+    )
+
+    return item_model, page_model
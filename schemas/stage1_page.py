@@ -7,140 +7,68 @@ This schema includes continuation tracking fields for multi-page contributions.
 Based on: docs/ontology.md v1.0
 """
 
-from typing import List, Literal, Optional
-
-from pydantic import BaseModel, Field
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, get_args
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from . import get_schema as _variant_schema
+from . import get_schema_bytes as _variant_schema_bytes
+from ._descriptions import (
+    CONTINUES_ON_NEXT_PAGE_DESC,
+    DATE_STRING_DESC,
+    ISSUE_LABEL_DESC,
+    IS_CONTINUATION_DESC,
+    ITEMS_DESC_V1,
+    ITEM_AUTHOR_DESC_V1,
+    ITEM_CLASS_DESC_V1,
+    ITEM_TEXT_RAW_DESC_V1,
+    ITEM_TITLE_DESC,
+    MAG_TITLE_DESC,
+    PAGE_REF_DESC,
+)
 
 # Item classification vocabulary
 ITEM_CLASS = Literal["prose", "verse", "ad", "paratext", "unknown"]
 
+# Same vocabulary as a set, for O(1) membership checks outside Pydantic
+ITEM_CLASS_VALUES: FrozenSet[str] = frozenset(get_args(ITEM_CLASS))
+
 
 class Stage1Item(BaseModel):
     """
     A discrete text block on the page (contribution, advertisement, or paratextual element).
     """
 
+    # Instances are read-only once validated; unknown keys are dropped
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     item_class: ITEM_CLASS = Field(
         ...,
-        description=(
-            "Classification of the text block's content type:\n"
-            "- 'prose': Continuous prose text (articles, essays, short stories, reviews, "
-            "literary criticism, chronicles). Characterized by paragraph structure.\n"
-            "- 'verse': Poetry with line breaks and potential stanza structure. "
-            "Includes both measured and free verse.\n"
-            "- 'ad': Advertisements and commercial content. Book announcements, "
-            "publisher advertisements, commercial announcements.\n"
-            "- 'paratext': Editorial framing and metadata including:\n"
-            "  * Magazine title/masthead (e.g., 'LA PLUME') - extract as item even if in mag_title field\n"
-            "  * Issue numbers, dates, page numbers - extract even if in other fields\n"
-            "  * Section headers, table of contents\n"
-            "  * Running headers/footers\n"
-            "  * Printer information, editor/manager names\n"
-            "  * Subscription notices, pricing for magazine itself\n"
-            "  * Portrait/illustration announcements\n"
-            "- 'unknown': Classification uncertain. Use only when genuinely ambiguous. "
-            "Prefer specific classifications when possible.\n\n"
-            "Classification is based on content nature, not structural position on page."
-        ),
+        description=ITEM_CLASS_DESC_V1,
     )
 
     item_text_raw: str = Field(
         ...,
-        description=(
-            "Complete text of this block exactly as printed.\n\n"
-            "COMPLETENESS:\n"
-            "Include ALL elements: title, subtitles, body text, author (beginning OR end), "
-            "continuation markers (e.g., '(Suite)', '(À Suivre.)'), source attributions.\n\n"
-            "CRITICAL - LINE BREAKS:\n"
-            "For PROSE (articles, stories, essays):\n"
-            "- Use \\n\\n ONLY for paragraph breaks (blank line or first-line indent in original)\n"
-            "- DO NOT use \\n for visual line wraps in the printed layout\n"
-            "- A continuous paragraph must be continuous text without line breaks\n"
-            "- Common error: Adding \\n at every line wrap. DON'T DO THIS.\n"
-            "- Exception: Use \\n for distinct visual elements like 'NUMÉRO 10\\n1er SEPTEMBRE 1889'\n\n"
-            "For VERSE (poetry):\n"
-            "- Preserve ALL line breaks exactly as printed\n"
-            "- Each verse line = one line with \\n\n"
-            "- Stanza breaks = \\n\\n\n"
-            "- CRITICAL: If a verse line is too long and wraps to next line (often right-aligned), "
-            "this is STILL THE SAME VERSE LINE. Join them without \\n. "
-            "HYPHENATION:\n"
-            "- REMOVE layout hyphens: 'extraordi-\\naire' becomes 'extraordinaire'\n"
-            "- KEEP real hyphens: 'peut-être', 'vis-à-vis', 'celle-ci'\n"
-            "- Common error: Keeping 'devant les-\\nquelles' instead of 'devant lesquelles'. "
-            "Remove the hyphen AND join the words.\n\n"
-            "ORTHOGRAPHY:\n"
-            "- Preserve capitalization exactly (note: 19th century capitals often lack accents: 'A cette époque')\n"
-            "- Preserve ALL accents as printed: è é ê à ù etc.\n"
-            "- Preserve ligatures: œ, æ\n"
-            '- Preserve quotation marks: « » or " as printed\n'
-            "- Preserve '&' if present\n"
-            "- Preserve spacing around punctuation AS PRINTED (inconsistent in originals)"
-        ),
+        description=ITEM_TEXT_RAW_DESC_V1,
     )
 
     item_title: Optional[str] = Field(
         None,
-        description=(
-            "Title or heading of the contribution, if printed.\n"
-            "Extract even if displayed in decorative, display, or non-standard font.\n"
-            "Transcribe exactly as printed.\n"
-            "Set to null if no title is present.\n"
-            "Note: Title should also appear in item_text_raw."
-        ),
+        description=ITEM_TITLE_DESC,
     )
 
     item_author: Optional[str] = Field(
         None,
-        description=(
-            "Author name(s) attributed to this contribution, if printed.\n\n"
-            "CRITICAL: Author may appear at BEGINNING or END of text. "
-            "Check BOTH locations. Most commonly, authors appear at the END.\n\n"
-            "Common error: Missing author because it's at the end after the text. "
-            "Always check the last line.\n\n"
-            "Format preservation:\n"
-            "- Transcribe exactly as printed\n"
-            "- Multiple authors: 'Edmond et Jules de Goncourt'\n"
-            "- Name variations: 'Jules Laforgue', 'J. Laforgue', 'Laforgue'\n"
-            "Note: Author must also appear in item_text_raw."
-        ),
+        description=ITEM_AUTHOR_DESC_V1,
     )
     is_continuation: Optional[bool] = Field(
         None,
-        description=(
-            "Indicates whether this item continues from the previous page.\n\n"
-            "Set to true if evidence strongly suggests this is a continuation:\n"
-            "- Text starts with lowercase letter (mid-sentence)\n"
-            "- No title present when one would be expected for this item type\n"
-            "- Text clearly begins mid-paragraph or mid-thought\n\n"
-            "Omit this field entirely if the item does NOT continue from previous page. "
-            "Evidence suggests that the text starts a new contribution and it's not a continuation:\n"
-            "- Text starts with capital letter and appears to be beginning of sentence\n"
-            "- Title is present\n"
-            "- Content appears self-contained\n\n"
-            "Note: An item can be BOTH a continuation from previous page AND continue to next page. "
-            "In this case, both is_continuation and continues_on_next_page will be true.\n\n"
-            "Never set to false - absence of field indicates no continuation."
-        ),
+        description=IS_CONTINUATION_DESC,
     )
 
     continues_on_next_page: Optional[bool] = Field(
         None,
-        description=(
-            "Indicates whether this item continues to the next page.\n\n"
-            "Set to true if evidence strongly suggests continuation follows:\n"
-            "- Text ends mid-sentence with no closing punctuation\n"
-            "- No author attribution at the end when expected for this item type\n"
-            "- Narrative or argument clearly incomplete\n\n"
-            "Evidence that suggests the contribution is complete and doesn't continue in the next page:\n"
-            "- Text ends with closing punctuation (period, exclamation, question mark)\n"
-            "- Author attribution present at end\n"
-            "- Content appears complete (story ends, poem concludes, article reaches conclusion)\n\n"
-            "Omit this field entirely if the item does NOT continue to next page. "
-            "Note: An item can be BOTH a continuation from previous page AND continue to next page. "
-            "In this case, both is_continuation and continues_on_next_page will be true.\n\n"
-            "Never set to false - absence of field indicates no continuation."
-        ),
+        description=CONTINUES_ON_NEXT_PAGE_DESC,
     )
 
 
@@ -150,73 +78,46 @@ class Stage1PageModel(BaseModel):
     Includes page metadata and all text items in reading order.
     """
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     mag_title: Optional[str] = Field(
         None,
-        description=(
-            "Magazine title as printed on this specific page. "
-            "Transcribe exactly as it appears, even if stylized or in decorative font. "
-            "Usually found in masthead, running header, or decorative logo. "
-            "Set to null if not visible on this page."
-        ),
+        description=MAG_TITLE_DESC,
     )
 
     issue_label: Optional[str] = Field(
         None,
-        description=(
-            "Issue number or label as printed on the page. "
-            "Preserve original formatting and language. "
-            "May include year, volume, or series information. "
-            "Examples: 'N° 10', 'Première année', 'Tome II, N° 5'. "
-            "Set to null if not present on this page."
-        ),
+        description=ISSUE_LABEL_DESC,
     )
 
     date_string: Optional[str] = Field(
         None,
-        description=(
-            "Publication date as printed on this page. "
-            "Preserve original formatting - do not standardize or modernize. "
-            "Keep period-appropriate orthography. "
-            "Examples: 'Juin 89.', '1er Septembre 1889', '15 juin 1890'. "
-            "Set to null if not present on this page."
-        ),
+        description=DATE_STRING_DESC,
     )
 
     page_ref: Optional[str] = Field(
         None,
-        description=(
-            "Page number as printed on this page. "
-            "Transcribe exactly as formatted. "
-            "Examples: '100', 'p. 45', '- 23 -'. "
-            "Set to null if not present."
-        ),
+        description=PAGE_REF_DESC,
     )
 
     items: List[Stage1Item] = Field(
         ...,
-        description=(
-            "Ordered list of ALL text blocks appearing on the page.\n\n"
-            "CRITICAL: Extract EVERY piece of text visible on the page as a separate item. "
-            "This includes:\n"
-            "- Magazine masthead and title (even if already in mag_title field)\n"
-            "- Issue information, dates, page numbers (even if in other fields)\n"
-            "- Literary contributions (prose, verse)\n"
-            "- Advertisements and announcements\n"
-            "- Editorial content and notes\n"
-            "- Printer information\n"
-            "- Subscription forms\n"
-            "- Running headers/footers\n"
-            "- Section titles\n\n"
-            "READING ORDER RULES:\n"
-            "1. Direction: Top to bottom, left to right.\n"
-            "2. Multi-column layouts: Complete left column entirely, then right column.\n"
-            "3. CRITICAL - Column-spanning contributions: When a SINGLE contribution spans multiple columns, "
-            "treat it as ONE item. Combine text from left column + right column in item_text_raw. "
-            "DO NOT create separate items for each column of the same contribution. "
-            "Common error: Splitting one poem/article into two items because of column break. DON'T DO THIS.\n"
-            "4. Missing text: If text continues in a second column, you MUST include it. "
-            "Do not omit the second half of contributions.\n"
-            "5. Natural reading: Follow the sequence a reader would naturally follow.\n\n"
-            "Empty pages: For blank pages, items may be empty list []."
-        ),
+        description=ITEMS_DESC_V1,
     )
+
+
+def get_schema() -> Dict[str, Any]:
+    """
+    JSON schema for Stage1PageModel, built on first call and reused.
+
+    The returned dict is shared between callers: do not mutate it
+    (use copy.deepcopy first if it needs editing).
+    """
+    return _variant_schema("stage1_page")
+
+
+def get_schema_bytes() -> bytes:
+    """
+    Compact UTF-8 JSON encoding of get_schema(), for sending as-is.
+    """
+    return _variant_schema_bytes("stage1_page")
@@ -0,0 +1,109 @@
+"""Test item matching used by the evaluation metrics."""
+
+import json
+from difflib import SequenceMatcher
+
+import pytest
+from rapidfuzz import fuzz
+
+from utils.evaluation import (load_and_match_page, load_and_match_pages,
+                              match_items, metadata_similarity,
+                              similarity_matrix, text_similarity)
+
+# A long gold item (373 chars) and the same text with three substitutions
+_LONG_GOLD = (
+    "Lorsqu'il sera bien dit que de sa pourriture\nIl ne saurait pas revenir,\n"
+    "Qu'on aura pour jamais dans cette sépulture\nJeté son boueux souvenir.\n\n"
+    "Alors, alors enfin, sans honte et sans faiblesse\nNous pourrons sourire au printemps,\n"
+    "Rien ne souillera plus le front de la jeunesse,\nNous songerons à nos vingt ans !\n\n"
+    "— 1868 —\nGustave Rivet.\n\n(HECTOR L'ESTRAZ, escholier de Paris.)"
+)
+_LONG_PRED = _LONG_GOLD[:28] + " " + _LONG_GOLD[29:164] + "b" + _LONG_GOLD[165:280] + "e" + _LONG_GOLD[281:]
+
+
+def _items(*texts):
+    return [{"item_class": "prose", "item_text_raw": t} for t in texts]
+
+
+def test_text_similarity_ignores_case_and_punctuation():
+    """Matching similarity is computed on normalized text."""
+    assert text_similarity("Hello, World!", "hello world") == 1.0
+    assert text_similarity("", "") == 1.0
+    assert text_similarity("text", "") == 0.0
+
+
+def test_greedy_matching_threshold():
+    """Items below the similarity threshold stay unmatched."""
+    gold = _items("la revue blanche", "un texte sans rapport")
+    pred = _items("La Revue blanche.", "zzzz")
+    matches, unmatched_gold, unmatched_pred = match_items(gold, pred, 0.7)
+    assert [(g, p) for g, p, _ in matches] == [(0, 0)]
+    assert unmatched_gold == {1}
+    assert unmatched_pred == {1}
+
+
+def test_optimal_matching_is_order_independent():
+    """Optimal assignment maximizes total similarity where greedy does not."""
+    gold = _items("abcdefgh", "abcdefgx")
+    pred = _items("abcdefgx", "abcdefgh ij")
+    greedy, _, _ = match_items(gold, pred, 0.7)
+    optimal, _, _ = match_items(gold, pred, 0.7, optimal=True)
+    assert [(g, p) for g, p, _ in greedy] == [(0, 0), (1, 1)]
+    assert [(g, p) for g, p, _ in optimal] == [(0, 1), (1, 0)]
+    assert sum(s for _, _, s in optimal) > sum(s for _, _, s in greedy)
+
+
+def test_load_and_match_pages_keeps_order(tmp_path):
+    """Parallel page loading returns the same results as one-by-one loading."""
+    pairs = []
+    for i, texts in enumerate([("une page",), ("deux", "items"), ()]):
+        gold = tmp_path / f"gold_{i}.json"
+        pred = tmp_path / f"pred_{i}.json"
+        gold.write_text(json.dumps({"items": _items(*texts)}), encoding="utf-8")
+        pred.write_text(json.dumps({"items": _items(*reversed(texts))}), encoding="utf-8")
+        pairs.append((gold, pred))
+
+    expected = [load_and_match_page(gold, pred) for gold, pred in pairs]
+    assert load_and_match_pages(pairs, max_workers=2) == expected
+    assert load_and_match_pages(pairs, max_workers=1) == expected
+
+
+def test_default_scorer_pins_long_item_scores():
+    """difflib (default) and Indel score long near-identical items differently."""
+    gold = _items(_LONG_GOLD)
+    pred = _items(_LONG_PRED)
+
+    # difflib's autojunk makes this pair fall well below the threshold
+    assert text_similarity(_LONG_GOLD, _LONG_PRED) == pytest.approx(0.3262, abs=1e-4)
+    matches, _, _ = match_items(gold, pred, 0.7)
+    assert matches == []
+
+    assert text_similarity(_LONG_GOLD, _LONG_PRED, scorer="indel") == pytest.approx(0.9928, abs=1e-4)
+    matches, _, _ = match_items(gold, pred, 0.7, scorer="indel")
+    assert [(g, p) for g, p, _ in matches] == [(0, 0)]
+
+
+@pytest.mark.parametrize("scorer", ["difflib", "indel"])
+def test_similarity_matrix_matches_pairwise(scorer):
+    """The score matrix agrees with text_similarity for every pair."""
+    gold = _items("la revue blanche", "", _LONG_GOLD, "un texte")
+    pred = _items("La Revue blanche.", _LONG_PRED, "", "texte")
+    matrix = similarity_matrix(gold, pred, scorer=scorer)
+    for g, gold_item in enumerate(gold):
+        for p, pred_item in enumerate(pred):
+            expected = text_similarity(
+                gold_item["item_text_raw"], pred_item["item_text_raw"], scorer=scorer
+            )
+            assert matrix[g, p] == pytest.approx(expected)
+
+
+def test_metadata_similarity_follows_scorer():
+    """Metadata is scored with the configured scorer, difflib by default."""
+    gold, pred = "Gustave Rivet", "Gustave Rivét."
+    expected = SequenceMatcher(None, "gustave rivet", "gustave rivét").ratio()
+    assert metadata_similarity(gold, pred) == pytest.approx(expected)
+    assert metadata_similarity(gold, pred, scorer="indel") == pytest.approx(
+        fuzz.ratio("gustave rivet", "gustave rivét") / 100.0
+    )
+    assert metadata_similarity(None, None) == 1.0
+    assert metadata_similarity("Rivet", "") == 0.0
@@ -0,0 +1,254 @@
+"""Test per-page extraction with fake providers and clients (no API calls)."""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from pydantic_core import PydanticSerializationError
+
+import utils.providers
+from schemas.stage1_page import Stage1PageModel
+from utils import extraction
+from utils.extraction import extract_pdf_pages
+
+N_PAGES = 8
+
+
+def _annot(page_num):
+    return {"items": [{"item_class": "prose", "item_text_raw": f"Text of page {page_num}"}]}
+
+
+class FakeProvider:
+    """Provider whose pages take a moment, failing the given page numbers."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.calls = []
+        self.closed = False
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def process_page(self, pdf_path, page_num, schema_class, **kwargs):
+        with self._lock:
+            self.calls.append(page_num)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(0.02)
+            if page_num in self.fail:
+                raise RuntimeError(f"page {page_num} rejected")
+            return _annot(page_num)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pdf(tmp_path, monkeypatch):
+    """A PDF path whose page count is faked."""
+    monkeypatch.setattr(extraction, "count_pages", lambda path: N_PAGES)
+    return tmp_path / "issue.pdf"
+
+
+@pytest.fixture
+def use_provider(monkeypatch):
+    def install(provider):
+        monkeypatch.setattr(utils.providers, "get_model_provider", lambda name: provider)
+        return provider
+    return install
+
+
+def _page_file(out_dir, page_num):
+    return out_dir / f"issue__page-{page_num:03d}.json"
+
+
+def _run_provider(pdf, out_dir, **kwargs):
+    return extract_pdf_pages(
+        pdf, Stage1PageModel, None, out_dir,
+        model_name="pixtral-12b-latest", use_providers=True, max_retries=1, **kwargs
+    )
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_provider_pages_all_written(pdf, tmp_path, use_provider, max_concurrency):
+    """Every page is written, concurrently when allowed."""
+    provider = use_provider(FakeProvider())
+    out_dir = tmp_path / "out"
+    stats = _run_provider(pdf, out_dir, max_concurrency=max_concurrency)
+    assert stats == {"written": N_PAGES, "skipped": 0, "failed": 0, "total": N_PAGES}
+    for p in range(1, N_PAGES + 1):
+        assert json.loads(_page_file(out_dir, p).read_text(encoding="utf-8")) == _annot(p)
+    assert (out_dir / "_COMPLETE.ok").exists()
+    assert sorted(provider.calls) == list(range(1, N_PAGES + 1))
+    if max_concurrency > 1:
+        assert provider.max_in_flight > 1
+    assert provider.closed
+
+
+def test_provider_failures_counted_concurrently(pdf, tmp_path, use_provider):
+    """Failed pages are counted and leave no file or completion marker."""
+    use_provider(FakeProvider(fail={3, 6}))
+    out_dir = tmp_path / "out"
+    stats = _run_provider(pdf, out_dir, max_concurrency=4)
+    assert stats == {"written": N_PAGES - 2, "skipped": 0, "failed": 2, "total": N_PAGES}
+    assert not _page_file(out_dir, 3).exists()
+    assert not _page_file(out_dir, 6).exists()
+    assert not (out_dir / "_COMPLETE.ok").exists()
+
+
+@pytest.mark.parametrize("overwrite", [False, True])
+def test_provider_skip_and_overwrite(pdf, tmp_path, use_provider, overwrite):
+    """Existing pages are skipped unless overwrite is set."""
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    _page_file(out_dir, 2).write_text("{}", encoding="utf-8")
+    provider = use_provider(FakeProvider())
+    stats = _run_provider(pdf, out_dir, overwrite=overwrite, max_concurrency=4)
+    if overwrite:
+        assert stats["written"] == N_PAGES and stats["skipped"] == 0
+        assert json.loads(_page_file(out_dir, 2).read_text(encoding="utf-8")) == _annot(2)
+    else:
+        assert stats["written"] == N_PAGES - 1 and stats["skipped"] == 1
+        assert _page_file(out_dir, 2).read_text(encoding="utf-8") == "{}"
+        assert 2 not in provider.calls
+
+
+def test_run_page_tasks_closed_early_runs_no_queued_pages():
+    """Closing the outcome generator stops pages that were not yet submitted."""
+    calls = []
+    lock = threading.Lock()
+
+    def process_page(page):
+        with lock:
+            calls.append(page)
+        time.sleep(0.02)
+        return "written"
+
+    outcomes = extraction._run_page_tasks(list(range(1, 41)), process_page, "test", 2)
+    assert next(outcomes) == "written"
+    outcomes.close()
+    time.sleep(0.1)
+    # The two initial pages plus the one refilled before the first outcome
+    assert len(calls) <= 3
+    assert set(calls) <= {1, 2, 3}
+
+
+class FakeClient:
+    """Mistral client stand-in recording file uploads and OCR requests."""
+
+    def __init__(self, upload_error=None, fail_pages=()):
+        self.upload_error = upload_error
+        self.fail_pages = set(fail_pages)
+        self.uploaded = []
+        self.deleted = []
+        self.document_urls = []
+        self._lock = threading.Lock()
+        self.files = self
+        self.ocr = self
+
+    def upload(self, file, purpose):
+        if self.upload_error is not None:
+            raise self.upload_error
+        self.uploaded.append(file["file_name"])
+        return SimpleNamespace(id="file-1")
+
+    def get_signed_url(self, file_id):
+        return SimpleNamespace(url=f"https://files.example/{file_id}")
+
+    def delete(self, file_id):
+        self.deleted.append(file_id)
+
+    def process(self, model, document, pages, **kwargs):
+        (page_idx,) = pages
+        with self._lock:
+            self.document_urls.append(document["document_url"])
+        if page_idx + 1 in self.fail_pages:
+            raise RuntimeError(f"page {page_idx + 1} rejected")
+        return SimpleNamespace(document_annotation=json.dumps(_annot(page_idx + 1)))
+
+
+@pytest.fixture
+def real_pdf(pdf):
+    pdf.write_bytes(b"%PDF-1.4 fake")
+    return pdf
+
+
+def _run_legacy(pdf, client, out_dir, **kwargs):
+    return extract_pdf_pages(pdf, Stage1PageModel, client, out_dir, max_retries=1, **kwargs)
+
+
+def test_legacy_uploads_once_and_deletes(real_pdf, tmp_path):
+    """Pages reference one uploaded file, deleted once the PDF is done."""
+    client = FakeClient()
+    out_dir = tmp_path / "out"
+    stats = _run_legacy(real_pdf, client, out_dir, max_concurrency=4)
+    assert stats["written"] == N_PAGES
+    assert client.uploaded == ["issue.pdf"]
+    assert set(client.document_urls) == {"https://files.example/file-1"}
+    assert client.deleted == ["file-1"]
+
+
+def test_legacy_deletes_upload_when_pages_fail(real_pdf, tmp_path):
+    """The uploaded file is deleted even when pages fail."""
+    client = FakeClient(fail_pages={1, 5})
+    stats = _run_legacy(real_pdf, client, tmp_path / "out", max_concurrency=4)
+    assert stats["failed"] == 2 and stats["written"] == N_PAGES - 2
+    assert client.deleted == ["file-1"]
+
+
+def test_legacy_falls_back_to_data_url(real_pdf, tmp_path):
+    """A failed upload sends the PDF inline and deletes nothing."""
+    client = FakeClient(upload_error=RuntimeError("upload refused"))
+    stats = _run_legacy(real_pdf, client, tmp_path / "out")
+    assert stats["written"] == N_PAGES
+    assert set(client.document_urls) == {extraction.encode_file_to_data_url(real_pdf)}
+    assert client.deleted == []
+
+
+def test_legacy_no_upload_when_pages_exist(real_pdf, tmp_path):
+    """Nothing is uploaded when every page is already extracted."""
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    for p in range(1, N_PAGES + 1):
+        _page_file(out_dir, p).write_text("{}", encoding="utf-8")
+    client = FakeClient()
+    stats = _run_legacy(real_pdf, client, out_dir)
+    assert stats["skipped"] == N_PAGES
+    assert client.uploaded == [] and client.deleted == []
+
+
+def test_write_annotation_round_trips(tmp_path):
+    """Annotations are written as JSON with no temp file left behind."""
+    out_json = tmp_path / "issue__page-001.json"
+    extraction._write_annotation(out_json, _annot(1))
+    assert json.loads(out_json.read_text(encoding="utf-8")) == _annot(1)
+    assert [p.name for p in tmp_path.iterdir()] == [out_json.name]
+
+
+def test_write_annotation_failed_serialization_leaves_nothing(tmp_path):
+    """An annotation that cannot be serialized leaves no .json or .json.tmp."""
+    out_json = tmp_path / "issue__page-001.json"
+    with pytest.raises(PydanticSerializationError):
+        extraction._write_annotation(out_json, {"items": [object()]})
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_annotation_failed_rename_keeps_previous_page(tmp_path, monkeypatch):
+    """A failed rename removes the temp file and keeps the old page intact."""
+    out_json = tmp_path / "issue__page-001.json"
+    out_json.write_text("{}", encoding="utf-8")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(extraction.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        extraction._write_annotation(out_json, _annot(1))
+    assert [p.name for p in tmp_path.iterdir()] == [out_json.name]
+    assert out_json.read_text(encoding="utf-8") == "{}"
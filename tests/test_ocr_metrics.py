@@ -1,6 +1,11 @@
 """Test OCR evaluation metrics."""
 
-from utils.ocr_metrics import character_error_rate, word_error_rate
+from utils.ocr_metrics import (CorpusErrorRate, batch_cer, cer_components,
+                               character_error_rate,
+                               character_error_rate_bounded,
+                               evaluate_corpus_quality,
+                               evaluate_text_quality,
+                               evaluate_text_quality_batch, word_error_rate)
 
 
 def test_cer_identical_strings():
@@ -55,3 +60,56 @@ def test_empty_strings():
     assert character_error_rate("", "", "standard") == 0.0
     assert character_error_rate("", "text", "standard") == 1.0
     assert word_error_rate("", "", "standard") == 0.0
+
+
+def test_batch_matches_single_evaluation():
+    """Batch evaluation returns per-pair results in input order."""
+    golds = ["hello world", "abcde", "hello"]
+    preds = ["hello earth", "fghij", "helo"]
+    expected = [evaluate_text_quality(g, p) for g, p in zip(golds, preds)]
+    assert evaluate_text_quality_batch(golds, preds, max_workers=1) == expected
+    assert evaluate_text_quality_batch(golds, preds, max_workers=2) == expected
+
+
+def test_bounded_cer_returns_none_above_threshold():
+    """Bounded CER is exact within the bound and None beyond it."""
+    assert character_error_rate_bounded("hello", "helo", "standard", max_cer=0.2) == 0.2
+    assert character_error_rate_bounded("hello", "helo", "standard", max_cer=0.1) is None
+    assert character_error_rate_bounded("abcde", "fghij", "standard", max_cer=0.5) is None
+
+
+def test_batch_cer_matches_pairwise():
+    """Bulk CER equals per-pair CER, including empty references."""
+    golds = ["hello", "abcde", "", ""]
+    preds = ["helo", "fghij", "text", ""]
+    expected = [character_error_rate(g, p, "standard") for g, p in zip(golds, preds)]
+    assert batch_cer(golds, preds, "standard") == expected == [0.2, 1.0, 1.0, 0.0]
+    assert batch_cer(golds, preds, "standard", max_workers=None) == expected
+
+
+def test_corpus_error_rate_weights_by_length():
+    """Corpus CER divides summed distances by summed reference lengths."""
+    corpus = CorpusErrorRate("cer", "standard")
+    corpus.update("hello", "helo")
+    corpus.update("abcdefghij", "abcdefghij")
+    assert cer_components("hello", "helo", "standard") == (1, 5)
+    assert corpus.compute() == 1 / 15
+
+    corpus_wer = CorpusErrorRate("wer", "standard")
+    corpus_wer.update("hello world", "hello earth")
+    assert corpus_wer.compute() == word_error_rate("hello world", "hello earth", "standard")
+    assert CorpusErrorRate().compute() == 0.0
+
+
+def test_corpus_quality_matches_streaming_aggregator():
+    """Bulk corpus evaluation agrees with CorpusErrorRate at every level."""
+    golds = ["hello world", "abcde", "Hello  world!"]
+    preds = ["hello earth", "fghij", "Hello world"]
+    results = evaluate_corpus_quality(golds, preds, max_workers=1)
+    for norm, rates in results.items():
+        for metric, rate in rates.items():
+            corpus = CorpusErrorRate(metric, norm)
+            for gold, pred in zip(golds, preds):
+                corpus.update(gold, pred)
+            assert rate == corpus.compute()
+    assert evaluate_corpus_quality(golds, preds) == results
@@ -0,0 +1,191 @@
+"""Test provider caching and page prefetching (encoding and rendering are mocked)."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from utils.providers import mistral_ocr, mistral_vision
+from utils.providers._shared import BoundedCache
+from utils.providers.mistral_ocr import MistralOCRProvider
+from utils.providers.mistral_vision import (_PREFETCH_AHEAD, _PREFETCH_BATCH,
+                                            MistralVisionProvider)
+
+PDF = Path("issue.pdf")
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Record batch and inline renders instead of running poppler."""
+    calls = {"batch": [], "inline": []}
+    lock = threading.Lock()
+
+    def fake_batch(pdf_path, first, last, **kwargs):
+        with lock:
+            calls["batch"].append((first, last))
+        return {p: f"batch-{p}" for p in range(first, last + 1)}
+
+    def fake_inline(pdf_path, page_num, **kwargs):
+        with lock:
+            calls["inline"].append(page_num)
+        return f"inline-{page_num}"
+
+    monkeypatch.setattr(mistral_vision, "pdf_pages_to_base64_images", fake_batch)
+    monkeypatch.setattr(mistral_vision, "pdf_page_to_base64_image", fake_inline)
+    return calls
+
+
+def _provider(**kwargs):
+    return MistralVisionProvider(api_key="test", model_name="pixtral-12b-latest", **kwargs)
+
+
+@pytest.mark.parametrize("cache_size", [1, 4, 32])
+def test_prefetch_renders_each_page_once_in_full_batches(renders, cache_size):
+    """Contiguous pages go out in full batches, even with a small cache."""
+    provider = _provider(image_cache_size=cache_size)
+    pages = list(range(1, 41))
+    provider.prefetch_pages(PDF, pages)
+    try:
+        for p in pages:
+            assert provider._get_page_image(PDF, p) == f"batch-{p}"
+            assert len(provider._pending) <= _PREFETCH_AHEAD
+    finally:
+        provider.close()
+    assert renders["batch"] == [(p, p + _PREFETCH_BATCH - 1) for p in range(1, 41, _PREFETCH_BATCH)]
+    assert renders["inline"] == []
+
+
+def test_prefetch_window_is_bounded(renders):
+    """Only the lookahead window is submitted up front."""
+    provider = _provider()
+    provider.prefetch_pages(PDF, list(range(1, 101)))
+    try:
+        assert len(provider._pending) == _PREFETCH_AHEAD
+        assert sorted(p for _, p in provider._pending) == list(range(1, _PREFETCH_AHEAD + 1))
+    finally:
+        provider.close()
+
+
+def test_prefetch_splits_non_contiguous_runs(renders):
+    """A gap in the page list starts a new batch."""
+    provider = _provider()
+    provider.prefetch_pages(PDF, [1, 2, 3, 7, 8])
+    try:
+        for p in (1, 2, 3, 7, 8):
+            provider._get_page_image(PDF, p)
+    finally:
+        provider.close()
+    assert renders["batch"] == [(1, 3), (7, 8)]
+
+
+def test_failed_prefetch_falls_back_to_inline_render(renders, monkeypatch):
+    """A batch that raises is rendered page by page instead."""
+    def failing_batch(pdf_path, first, last, **kwargs):
+        raise RuntimeError("poppler crashed")
+
+    monkeypatch.setattr(mistral_vision, "pdf_pages_to_base64_images", failing_batch)
+    provider = _provider()
+    provider.prefetch_pages(PDF, [1, 2, 3])
+    try:
+        assert [provider._get_page_image(PDF, p) for p in (1, 2, 3)] == [
+            "inline-1", "inline-2", "inline-3"
+        ]
+    finally:
+        provider.close()
+    assert renders["inline"] == [1, 2, 3]
+
+
+def test_prefetch_with_other_settings_is_not_reused(renders):
+    """A page prefetched at another dpi is rendered again at the requested one."""
+    provider = _provider()
+    provider.prefetch_pages(PDF, [1], dpi=100)
+    try:
+        assert provider._get_page_image(PDF, 1, dpi=200) == "inline-1"
+    finally:
+        provider.close()
+
+
+def test_close_clears_prefetch_state(renders):
+    """close() drops unconsumed prefetches and later prefetches are no-ops."""
+    provider = _provider()
+    provider.prefetch_pages(PDF, list(range(1, 101)))
+    provider._get_page_image(PDF, 1)
+    provider.close()
+    assert provider._pending == {}
+    assert provider._plan == {}
+    provider.close()
+
+    provider.prefetch_pages(PDF, [50])
+    assert provider._pending == {}
+    assert provider._get_page_image(PDF, 50) == "inline-50"
+
+
+def test_bounded_cache_computes_concurrent_misses_once():
+    """Threads missing on the same key share one computation."""
+    cache = BoundedCache(2)
+    computed = []
+    start = threading.Barrier(8)
+
+    def compute():
+        computed.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    def worker(results):
+        start.wait()
+        results.append(cache.get_or_compute("pdf", compute))
+
+    results = []
+    threads = [threading.Thread(target=worker, args=(results,)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["value"] * 8
+    assert len(computed) == 1
+    assert len(cache) == 1
+
+
+def test_bounded_cache_failed_compute_is_retried():
+    """A compute that raises caches nothing, so the next call tries again."""
+    cache = BoundedCache(2)
+
+    def failing():
+        raise OSError("unreadable")
+
+    with pytest.raises(OSError):
+        cache.get_or_compute("pdf", failing)
+    assert "pdf" not in cache
+    assert cache.get_or_compute("pdf", lambda: "value") == "value"
+
+
+def test_ocr_provider_encodes_pdf_once_for_concurrent_pages(tmp_path, monkeypatch):
+    """Concurrent pages of one PDF share a single base64 encode."""
+    pdf = tmp_path / "issue.pdf"
+    pdf.write_bytes(b"%PDF-1.4 fake")
+    encodes = []
+
+    def fake_encode(path):
+        encodes.append(path)
+        time.sleep(0.05)
+        return "data:application/pdf;base64,AAAA"
+
+    monkeypatch.setattr(mistral_ocr, "encode_file_to_data_url", fake_encode)
+    monkeypatch.setattr(mistral_ocr, "response_format_for", lambda schema: None)
+    provider = MistralOCRProvider(api_key="test")
+    urls = []
+    provider.client = SimpleNamespace(ocr=SimpleNamespace(
+        process=lambda document, **kwargs: urls.append(document["document_url"])
+        or SimpleNamespace(document_annotation='{"items": []}')
+    ))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(
+            lambda p: provider.process_page(pdf, p, schema_class=None), range(1, 9)
+        ))
+    assert results == [{"items": []}] * 8
+    assert encodes == [pdf]
+    assert set(urls) == {"data:application/pdf;base64,AAAA"}
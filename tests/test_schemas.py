@@ -1,9 +1,11 @@
 """Test that Pydantic schemas validate correctly."""
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
-from schemas.stage1_page import Stage1PageModel
+from schemas.stage1_page import Stage1PageModel, get_schema, get_schema_bytes
 
 
 def test_valid_page():
@@ -40,3 +42,47 @@ def test_empty_page():
     data = {"items": []}
     page = Stage1PageModel(**data)
     assert len(page.items) == 0
+
+
+def test_cached_schema_matches_model():
+    """Cached schema export matches a fresh model_json_schema()."""
+    assert get_schema() is get_schema()
+    assert get_schema() == Stage1PageModel.model_json_schema()
+    assert json.loads(get_schema_bytes()) == get_schema()
+
+
+def test_cached_schema_per_variant():
+    """Package-level schema cache is keyed by variant module name."""
+    import schemas
+    from schemas.stage1_page_v2_medium import Stage1PageModel as MediumPageModel
+
+    assert schemas.get_schema("stage1_page") is get_schema()
+    assert schemas.get_schema("stage1_page_v2_medium") == MediumPageModel.model_json_schema()
+
+
+def test_v2_variants_continuation_fields():
+    """Factory-built v2 variants only carry continuation fields when asked."""
+    from schemas import (
+        stage1_page_v2,
+        stage1_page_v2_medium_pure,
+        stage1_page_v2_small,
+    )
+
+    assert "is_continuation" in stage1_page_v2.Stage1Item.model_fields
+    assert "continues_on_next_page" in stage1_page_v2_small.Stage1Item.model_fields
+    assert "is_continuation" not in stage1_page_v2_medium_pure.Stage1Item.model_fields
+
+    page = stage1_page_v2_small.Stage1PageModel(
+        items=[{"item_class": "verse", "item_text_raw": "Vers", "is_continuation": True}]
+    )
+    assert page.items[0].is_continuation is True
+
+
+def test_variants_load_lazily():
+    """Variant modules are reachable as attributes of the schemas package."""
+    import schemas
+
+    assert "stage1_page_v2_small_pure" in dir(schemas)
+    assert "is_continuation" not in schemas.stage1_page_v2_small_pure.Stage1Item.model_fields
+    with pytest.raises(AttributeError):
+        schemas.stage1_page_v9
@@ -1,6 +1,6 @@
 """Test text normalization functions."""
 
-from utils.text_processing import (normalize_text_letters_only,
+from utils.text_processing import (clear_caches, normalize_text_letters_only,
                                    normalize_text_standard,
                                    normalize_text_strict, token_sort_text)
 
@@ -56,3 +56,14 @@ def test_normalization_preserves_french_accents():
     assert "é" in normalize_text_strict(text)
     assert "é" in normalize_text_standard(text)
     assert "é" in normalize_text_letters_only(text)
+
+
+def test_normalization_is_memoized():
+    """Repeated normalization of the same text is served from the cache."""
+    clear_caches()
+    text = "Le  même\ntexte"
+    first = normalize_text_standard(text)
+    assert normalize_text_standard(text) == first == "Le même texte"
+    assert normalize_text_standard.cache_info().hits == 1
+    clear_caches()
+    assert normalize_text_standard.cache_info().currsize == 0
@@ -1,62 +1,60 @@
 """
 Utility modules for Stage 1 OCR processing.
-"""
-from .extraction import (
-    count_pages,
-    encode_file_to_data_url,
-    parse_annotation_response,
-    call_with_retry,
-    validate_extraction,
-    extract_pdf_pages,
-    extract_all_pdfs
-)
-
-from .paths import (
-    build_evaluation_path,
-    discover_all_extractions,
-    discover_available_magazines,
-    discover_existing_extractions,
-    generate_all_combinations,
-    calculate_missing_extractions,
-    detect_schema_family
-)
 
-from .evaluation import (
-    load_and_match_page,
-    evaluate_order_agnostic,
-    evaluate_structure_aware,
-    evaluate_classification,
-    evaluate_classification_detailed,
-    evaluate_metadata_field,
-    evaluate_continuation_all_items,
-    calculate_word_coverage,
-    calculate_character_coverage)
+Re-exports are resolved lazily (PEP 562): importing a light submodule such
+as utils.paths or utils.ocr_metrics does not pull in the Mistral client,
+pypdf or the Stage 1 schema models.
+"""
+import importlib
 
-__all__ = [
+# Public name -> submodule that defines it
+_EXPORTS = {
     # Extraction
-    'count_pages',
-    'encode_file_to_data_url',
-    'parse_annotation_response',
-    'call_with_retry',
-    'validate_extraction',
-    'extract_pdf_pages',
-    'extract_all_pdfs',
+    'count_pages': 'extraction',
+    'encode_file_to_data_url': 'providers._shared',
+    'parse_annotation_response': 'extraction',
+    'call_with_retry': 'extraction',
+    'validate_extraction': 'extraction',
+    'extract_pdf_pages': 'extraction',
+    'extract_all_pdfs': 'extraction',
     # Evaluation paths
-    'build_evaluation_path',
-    'discover_all_extractions',
-    'discover_available_magazines',
-    'discover_existing_extractions',
-    'generate_all_combinations',
-    'calculate_missing_extractions',
-    'detect_schema_family',
+    'build_evaluation_path': 'paths',
+    'discover_all_extractions': 'paths',
+    'discover_available_magazines': 'paths',
+    'discover_existing_extractions': 'paths',
+    'generate_all_combinations': 'paths',
+    'calculate_missing_extractions': 'paths',
+    'iter_missing_extractions': 'paths',
+    'detect_schema_family': 'paths',
     # Evaluation metrics
-    'load_and_match_page',
-    'evaluate_order_agnostic',
-    'evaluate_structure_aware',
-    'evaluate_classification',
-    'evaluate_classification_detailed',
-    'evaluate_metadata_field',
-    'evaluate_continuation_all_items',
-    'calculate_word_coverage',
-    'calculate_character_coverage'
-]
\ No newline at end of file
+    'load_and_match_page': 'evaluation',
+    'load_and_match_pages': 'evaluation',
+    'evaluate_order_agnostic': 'evaluation',
+    'evaluate_structure_aware': 'evaluation',
+    'evaluate_classification': 'evaluation',
+    'evaluate_classification_detailed': 'evaluation',
+    'evaluate_metadata_field': 'evaluation',
+    'evaluate_continuation_all_items': 'evaluation',
+    'calculate_word_coverage': 'evaluation',
+    'calculate_character_coverage': 'evaluation',
+    # OCR metrics
+    'character_error_rate': 'ocr_metrics',
+    'word_error_rate': 'ocr_metrics',
+    'evaluate_text_quality': 'ocr_metrics',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,39 @@
+"""
+Shared process-pool helper for the evaluation modules.
+Internal module: page matching and text-quality batches both fan
+independent, CPU-bound work out over worker processes.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, Sequence
+
+
+def parallel_map(
+    fn: Callable,
+    *iterables: Sequence,
+    max_workers: Optional[int] = None
+) -> list:
+    """
+    Like list(map(fn, *iterables)), spread over a process pool.
+
+    fn and the items must be picklable. Small inputs, or max_workers=1,
+    run in the calling process instead of paying for worker start-up.
+
+    Args:
+        fn: Function applied to each tuple of items
+        *iterables: Aligned input sequences
+        max_workers: Number of worker processes (default: os.cpu_count());
+            1 runs in the calling process
+
+    Returns:
+        Results in input order
+    """
+    n_items = min(len(items) for items in iterables)
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or n_items < 2:
+        return list(map(fn, *iterables))
+
+    # A few chunks per worker amortizes IPC while keeping the load balanced
+    chunksize = max(1, n_items // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fn, *iterables, chunksize=chunksize))
@@ -73,6 +73,15 @@ class EvaluationConfig:
     # Lower = more false matches, higher = missed valid matches
     similarity_threshold: float = 0.7
 
+    # Item (and metadata) matching scorer: "difflib" (SequenceMatcher.ratio, the published
+    # metric the threshold was calibrated on) or "indel" (rapidfuzz
+    # normalized Indel similarity). Indel is faster but is a different
+    # metric: difflib's autojunk heuristic can drop long (200+ chars)
+    # near-identical items far below the threshold, Indel does not, so more
+    # items match. On the gold pages both put the same 3 of 458 distinct
+    # item pairs above 0.7, so the threshold carries over.
+    similarity_scorer: str = "difflib"
+
     # Metadata matching: higher threshold for short strings
     metadata_similarity_threshold: float = 0.8
 
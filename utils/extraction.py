@@ -5,25 +5,48 @@ Used by notebooks for single-schema and batch extraction.
 """
 from __future__ import annotations
 import json
-import base64
+import os
 import logging
 import time
 import random
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Callable, Any
 from pypdf import PdfReader
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from mistralai import Mistral
-from mistralai.extra import response_format_from_pydantic_model
 from tqdm.auto import tqdm
 
+from .paths import iter_suffix_entries
+from .providers._shared import encode_file_to_data_url, response_format_for
+
 logger = logging.getLogger("extraction")
 
+# Serializes page annotations in pydantic-core (Rust). For the string/bool/list
+# payloads our schemas define, output is byte-identical to
+# json.dumps(annot, ensure_ascii=False, indent=2)
+_ANNOTATION_JSON = TypeAdapter(Dict[str, Any])
+
 
 # ============================================================================
 # PDF PROCESSING
 # ============================================================================
 
+def _iter_pdfs(root: Path) -> Iterator[Path]:
+    """
+    Yield PDF files under root, recursively and in no particular order.
+
+    Same selection as root.rglob("*.pdf") filtered by is_file() (symlinked
+    directories are not descended), but uses the scandir entries' cached
+    type information instead of a stat() per path. Hidden and cache
+    directories are pruned by the shared walker in utils.paths.
+    """
+    for entry in iter_suffix_entries(root, ".pdf"):
+        if entry.is_file():
+            yield Path(entry.path)
+
+
 def count_pages(pdf_path: Path) -> int:
     """
     Count number of pages in a PDF file.
@@ -45,25 +68,44 @@ def count_pages(pdf_path: Path) -> int:
                 logger.warning(f"Encrypted PDF (cannot decrypt): {pdf_path.name}")
                 return 0
             
-            return len(reader.pages)
+            # The page tree root records the total page count; reading it
+            # avoids walking (flattening) every page node
+            try:
+                count = int(reader.root_object["/Pages"]["/Count"])
+            except (KeyError, TypeError, ValueError):
+                count = 0
+            return count if count > 0 else len(reader.pages)
     except Exception as e:
         logger.warning(f"Could not read {pdf_path.name}: {e}")
         return 0
 
 
-def encode_file_to_data_url(path: Path, mime: str = "application/pdf") -> str:
+def _upload_pdf(client: Mistral, pdf_path: Path) -> tuple[str, Optional[str]]:
     """
-    Encode file as base64 data URL for Mistral API.
-    
+    Upload a PDF once so per-page OCR requests can reference it by URL.
+
+    Falls back to an inline data URL if the upload fails, which resends the
+    whole PDF with every page request.
+
     Args:
-        path: Path to file
-        mime: MIME type
-        
+        client: Mistral client
+        pdf_path: Path to PDF file
+
     Returns:
-        Data URL string (data:<mime>;base64,<encoded_content>)
+        Tuple of (document_url, file_id); file_id is None for the data URL
+        fallback, otherwise pass it to client.files.delete() when done
     """
-    b64 = base64.b64encode(path.read_bytes()).decode("utf-8")
-    return f"data:{mime};base64,{b64}"
+    try:
+        with pdf_path.open("rb") as fh:
+            uploaded = client.files.upload(
+                file={"file_name": pdf_path.name, "content": fh},
+                purpose="ocr",
+            )
+        signed = client.files.get_signed_url(file_id=uploaded.id)
+        return signed.url, uploaded.id
+    except Exception as e:
+        logger.warning(f"Upload of {pdf_path.name} failed, sending inline: {e}")
+        return encode_file_to_data_url(pdf_path), None
 
 
 # ============================================================================
@@ -118,7 +160,11 @@ def call_with_retry(
     max_delay: float = 8.0
 ) -> Any:
     """
-    Call function with exponential backoff retry logic.
+    Call function with retry logic using decorrelated-jitter backoff.
+
+    Each delay is drawn from [base_delay, 3 * previous delay] and capped at
+    max_delay, so concurrent workers retrying the same failure spread out
+    instead of retrying in lockstep.
     
     Args:
         fn: Function to call (no arguments)
@@ -132,6 +178,7 @@ def call_with_retry(
     Raises:
         Exception: If all retries fail
     """
+    delay = base_delay
     for attempt in range(retries):
         try:
             return fn()
@@ -139,11 +186,13 @@ def call_with_retry(
             if attempt == retries - 1:
                 raise
             
-            delay = min(max_delay, base_delay * (2 ** attempt))
-            jitter = delay * (1 + 0.25 * random.random())
+            delay = min(max_delay, random.uniform(base_delay, delay * 3))
             
-            logger.warning(f"API call failed ({e}). Retrying in {jitter:.1f}s...")
-            time.sleep(jitter)
+            logger.warning(
+                f"API call failed (attempt {attempt + 1}/{retries}: {e}). "
+                f"Retrying in {delay:.1f}s..."
+            )
+            time.sleep(delay)
 
 
 # ============================================================================
@@ -187,9 +236,10 @@ def validate_extraction(
         if len(text) < 3:
             warnings.append(f"Item {idx} has very short text ({len(text)} chars)")
     
-    # Schema validation with Pydantic
+    # Schema validation with Pydantic (the class validator is built once
+    # per schema, so model_validate already reuses it across pages)
     try:
-        schema_class(**annot)
+        schema_class.model_validate(annot)
     except ValidationError as e:
         warnings.append(f"Schema validation failed: {e}")
         return False, warnings
@@ -239,6 +289,76 @@ def _load_prompt(
 # CORE EXTRACTION
 # ============================================================================
 
+def _write_annotation(out_json: Path, annot: dict) -> None:
+    """
+    Write a page annotation atomically.
+
+    The JSON goes to a sibling temp file that is renamed over out_json, so
+    an interrupted run never leaves a truncated page that the pre-scan
+    would then treat as already extracted.
+    """
+    tmp = out_json.with_name(out_json.name + ".tmp")
+    try:
+        tmp.write_bytes(_ANNOTATION_JSON.dump_json(annot, indent=2))
+        os.replace(tmp, out_json)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _run_page_tasks(
+    pages: List[int],
+    process_page: Callable[[int], str],
+    desc: str,
+    max_concurrency: int = 1
+) -> Iterator[str]:
+    """
+    Run process_page over pages, yielding each outcome as pages complete.
+
+    With max_concurrency > 1 pages run on a thread pool: each page is a
+    blocking API call, and the GIL is released while waiting on the network.
+    At most max_concurrency pages are submitted at a time, so an interrupt
+    (or closing the generator early) leaves no queue of pending API calls.
+
+    Args:
+        pages: Page numbers/indices to process
+        process_page: Callable returning "written" or "failed"
+        desc: Progress bar label
+        max_concurrency: Maximum number of pages in flight
+
+    Yields:
+        Outcome string of each page (completion order, not page order)
+    """
+    progress = tqdm(total=len(pages), desc=desc, leave=False)
+    try:
+        if max_concurrency <= 1:
+            for page in pages:
+                yield process_page(page)
+                progress.update()
+        else:
+            remaining = iter(pages)
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                in_flight = {
+                    executor.submit(process_page, page)
+                    for page in islice(remaining, max_concurrency)
+                }
+                try:
+                    while in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        # Refill before yielding, so workers stay busy while
+                        # the caller handles the outcomes
+                        for page in islice(remaining, len(done)):
+                            in_flight.add(executor.submit(process_page, page))
+                        for future in done:
+                            yield future.result()
+                            progress.update()
+                finally:
+                    for future in in_flight:
+                        future.cancel()
+    finally:
+        progress.close()
+
+
 def _extract_pdf_pages_with_provider(
     pdf_path: Path,
     schema_class: type[BaseModel],
@@ -250,7 +370,8 @@ def _extract_pdf_pages_with_provider(
     base_delay: float = 1.0,
     max_delay: float = 8.0,
     prompt_name: Optional[str] = None,
-    system_prompt: Optional[str] = None
+    system_prompt: Optional[str] = None,
+    max_concurrency: int = 1
 ) -> Dict[str, int]:
     """
     Extract PDF pages using provider architecture.
@@ -260,6 +381,7 @@ def _extract_pdf_pages_with_provider(
     Args:
         prompt_name: Name of prompt file to load (e.g., "detailed_v1")
         system_prompt: Optional explicit prompt string (overrides prompt_name)
+        max_concurrency: Maximum number of pages extracted concurrently
     """
     from .providers import get_model_provider
 
@@ -283,12 +405,18 @@ def _extract_pdf_pages_with_provider(
     # Statistics
     stats = {"written": 0, "skipped": 0, "failed": 0, "total": n_pages}
 
-    # Pre-scan: find which pages need extraction
+    # Pre-scan: find which pages need extraction (output paths are built
+    # once here and reused by the page workers). The output dir is listed
+    # once rather than stat()ing every page file.
     pages_to_extract = []
+    page_paths: Dict[int, Path] = {}
+    stem = pdf_path.stem
+    existing = set() if overwrite else set(os.listdir(out_dir))
     for page_idx in range(n_pages):
         page_num = page_idx + 1
-        out_json = out_dir / f"{pdf_path.stem}__page-{page_num:0{zero_pad}d}.json"
-        if not out_json.exists() or overwrite:
+        name = f"{stem}__page-{page_num:0{zero_pad}d}.json"
+        page_paths[page_num] = out_dir / name
+        if overwrite or name not in existing:
             pages_to_extract.append(page_num)  # 1-indexed for provider
         else:
             stats["skipped"] += 1
@@ -305,15 +433,9 @@ def _extract_pdf_pages_with_provider(
         logger.info(f"✓ {pdf_path.name}: All pages already extracted")
         return stats
 
-    # Create progress bar
-    page_iterator = tqdm(pages_to_extract, desc=f"  {pdf_path.name}", leave=False)
-
-    for page_num in page_iterator:
-        out_json = out_dir / f"{pdf_path.stem}__page-{page_num:0{zero_pad}d}.json"
-        # Skip if exists and not overwriting
-        if out_json.exists() and not overwrite:
-            stats["skipped"] += 1
-            continue
+    def _process_one(page_num: int) -> str:
+        # Pre-scan already skipped existing outputs
+        out_json = page_paths[page_num]
         # Call provider with retry logic
         try:
             def _call():
@@ -336,8 +458,7 @@ def _extract_pdf_pages_with_provider(
 
         except Exception as e:
             logger.error(f"Page {page_num} failed after {max_retries} retries: {e}")
-            stats["failed"] += 1
-            continue
+            return "failed"
 
         # Ensure items key exists
         if "items" not in annot:
@@ -351,15 +472,34 @@ def _extract_pdf_pages_with_provider(
 
         # Write output
         try:
-            out_json.write_text(
-                json.dumps(annot, ensure_ascii=False, indent=2),
-                encoding="utf-8"
-            )
-            stats["written"] += 1
+            _write_annotation(out_json, annot)
+            return "written"
 
         except Exception as e:
             logger.error(f"Failed to write {out_json.name}: {e}")
-            stats["failed"] += 1
+            return "failed"
+
+    # Nothing renders in the background before prefetch_pages(), so only
+    # the prefetch and the page loop need the provider cleaned up after
+    try:
+        # Providers that render pages locally (vision models) can batch the
+        # rendering up front; on failure pages are rendered one by one instead
+        prefetch = getattr(provider, "prefetch_pages", None)
+        if prefetch is not None:
+            try:
+                prefetch(pdf_path, pages_to_extract)
+            except Exception as e:
+                logger.warning(f"Page prefetch failed for {pdf_path.name}: {e}")
+
+        for outcome in _run_page_tasks(
+            pages_to_extract, _process_one, f"  {pdf_path.name}", max_concurrency
+        ):
+            stats[outcome] += 1
+    finally:
+        # Cancel renders still queued for pages that were never consumed
+        close = getattr(provider, "close", None)
+        if close is not None:
+            close()
 
     try:
         if stats["total"] > 0 and (stats["written"] + stats["skipped"]) >= stats["total"]:
@@ -390,7 +530,8 @@ def extract_pdf_pages(
     max_delay: float = 8.0,
     use_providers: bool = False,
     prompt_name: Optional[str] = None,
-    system_prompt: Optional[str] = None
+    system_prompt: Optional[str] = None,
+    max_concurrency: int = 1
 ) -> Dict[str, int]:
     """
     Extract structured data from all pages of a PDF using a given schema.
@@ -412,6 +553,8 @@ def extract_pdf_pages(
         use_providers: If True, use provider architecture (default: False)
         prompt_name: Name of prompt file to load (e.g., "detailed_v1")
         system_prompt: Optional explicit system prompt string (overrides prompt_name)
+        max_concurrency: Maximum number of pages extracted concurrently per
+            PDF (default 1: sequential; keep within the API rate limit)
         
     Returns:
         Dict with statistics: {"written": n, "skipped": n, "failed": n, "total": n}
@@ -430,7 +573,8 @@ def extract_pdf_pages(
             base_delay=base_delay,
             max_delay=max_delay,
             prompt_name=prompt_name,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            max_concurrency=max_concurrency
         )
     
     # Legacy implementation without providers
@@ -449,22 +593,25 @@ def extract_pdf_pages(
     out_dir = out_root
     out_dir.mkdir(parents=True, exist_ok=True)
     
-    # Encode PDF
-    data_url = encode_file_to_data_url(pdf_path)
-    
     # Generate response format from schema
-    doc_annot_fmt = response_format_from_pydantic_model(schema_class)
+    doc_annot_fmt = response_format_for(schema_class)
     
     # Statistics
     stats = {"written": 0, "skipped": 0, "failed": 0, "total": n_pages}
     
-    # Pre-scan: find which pages need extraction
+    # Pre-scan: find which pages need extraction (output paths are built
+    # once here and reused by the page workers). The output dir is listed
+    # once rather than stat()ing every page file.
     pages_to_extract = []
+    page_paths: Dict[int, Path] = {}
+    stem = pdf_path.stem
+    existing = set() if overwrite else set(os.listdir(out_dir))
     for page_idx in range(n_pages):
         page_num = page_idx + 1
-        out_json = out_dir / f"{pdf_path.stem}__page-{page_num:0{zero_pad}d}.json"
+        name = f"{stem}__page-{page_num:0{zero_pad}d}.json"
+        page_paths[page_num] = out_dir / name
         
-        if not out_json.exists() or overwrite:
+        if overwrite or name not in existing:
             pages_to_extract.append(page_idx)
         else:
             stats["skipped"] += 1
@@ -481,25 +628,20 @@ def extract_pdf_pages(
         logger.info(f"✓ {pdf_path.name}: All pages already extracted")
         return stats
 
-    # Create progress bar
-    page_iterator = tqdm(pages_to_extract, desc=f"  {pdf_path.name}", leave=False)
+    # Upload PDF once; pages reference it instead of resending the bytes
+    document_url, file_id = _upload_pdf(client, pdf_path)
 
-    
-    for page_idx in page_iterator:
+    def _process_one(page_idx: int) -> str:
         page_num = page_idx + 1
-        out_json = out_dir / f"{pdf_path.stem}__page-{page_num:0{zero_pad}d}.json"
-        
-        # Skip if exists and not overwriting
-        if out_json.exists() and not overwrite:
-            stats["skipped"] += 1
-            continue
+        # Pre-scan already skipped existing outputs
+        out_json = page_paths[page_num]
         
         # Call API with retry logic
         try:
             def _call():
                 return client.ocr.process(
                     model=model_name,
-                    document={"type": "document_url", "document_url": data_url},
+                    document={"type": "document_url", "document_url": document_url},
                     pages=[page_idx],
                     document_annotation_format=doc_annot_fmt,
                     include_image_base64=False,
@@ -514,8 +656,7 @@ def extract_pdf_pages(
             
         except Exception as e:
             logger.error(f"Page {page_num} failed after {max_retries} retries: {e}")
-            stats["failed"] += 1
-            continue
+            return "failed"
         
         # Parse response
         annot = parse_annotation_response(resp) or {}
@@ -532,15 +673,24 @@ def extract_pdf_pages(
         
         # Write output
         try:
-            out_json.write_text(
-                json.dumps(annot, ensure_ascii=False, indent=2),
-                encoding="utf-8"
-            )
-            stats["written"] += 1
+            _write_annotation(out_json, annot)
+            return "written"
             
         except Exception as e:
             logger.error(f"Failed to write {out_json.name}: {e}")
-            stats["failed"] += 1
+            return "failed"
+    
+    try:
+        for outcome in _run_page_tasks(
+            pages_to_extract, _process_one, f"  {pdf_path.name}", max_concurrency
+        ):
+            stats[outcome] += 1
+    finally:
+        if file_id is not None:
+            try:
+                client.files.delete(file_id=file_id)
+            except Exception as e:
+                logger.warning(f"Failed to delete uploaded {pdf_path.name}: {e}")
     
     try:
         # Mark directory complete if all pages are present (written + previously skipped)
@@ -573,7 +723,8 @@ def extract_all_pdfs(
     max_delay: float = 8.0,
     use_providers: bool = False,
     prompt_name: Optional[str] = None,
-    system_prompt: Optional[str] = None
+    system_prompt: Optional[str] = None,
+    max_concurrency: int = 1
 ) -> Dict[str, int]:
     """
     Extract all PDFs in source directory using a given schema.
@@ -592,11 +743,13 @@ def extract_all_pdfs(
         use_providers: If True, use provider architecture (default: False)
         prompt_name: Name of prompt file to load (e.g., "detailed_v1")
         system_prompt: Optional explicit system prompt string (overrides prompt_name)
+        max_concurrency: Maximum number of pages extracted concurrently per
+            PDF (default 1: sequential; keep within the API rate limit)
         
     Returns:
         Combined statistics across all PDFs
     """
-    pdfs = sorted([p for p in src_root.rglob("*.pdf") if p.is_file()])
+    pdfs = sorted(_iter_pdfs(src_root))
     
     if not pdfs:
         logger.warning(f"No PDF files found in {src_root}")
@@ -621,7 +774,8 @@ def extract_all_pdfs(
             max_delay=max_delay,
             use_providers=use_providers,
             prompt_name=prompt_name,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            max_concurrency=max_concurrency
         )
         
         for key in total_stats:
@@ -1,7 +1,8 @@
 """
 OCR Evaluation Metrics
 
-Provides standard OCR quality metrics (CER, WER) using Levenshtein distance.
+Provides standard OCR quality metrics (CER, WER) using Levenshtein distance
+(rapidfuzz's bit-parallel implementation).
 These functions calculate error rates at character and word levels with
 support for multiple normalization strategies.
 
@@ -10,16 +11,62 @@ Used by:
 - 01d_comparative_evaluation.ipynb (Mistral vs BnF comparison)
 """
 
-from typing import Literal
+from functools import partial
+from typing import Literal, Optional, Sequence
 
-import Levenshtein
+import numpy as np
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
 
 # Import normalization functions from sibling module
+from ._parallel import parallel_map
 from .text_processing import (normalize_text_letters_only,
                               normalize_text_standard, normalize_text_strict)
 
 NormalizationType = Literal["strict", "standard", "letters_only"]
 
+_CER_NORMALIZERS = {
+    "strict": normalize_text_strict,
+    "standard": normalize_text_standard,
+    "letters_only": normalize_text_letters_only,
+}
+# WER doesn't make sense without word boundaries, so letters_only uses standard
+# TODO Find a more elegant wat to handle this
+_WER_NORMALIZERS = {**_CER_NORMALIZERS, "letters_only": normalize_text_standard}
+
+
+def _get_normalizer(table: dict, normalization: str):
+    """Look up a normalizer, rejecting unknown levels like the public API."""
+    try:
+        return table[normalization]
+    except KeyError:
+        raise ValueError(f"Unknown normalization: {normalization}") from None
+
+
+def _cer(ref: str, hyp: str) -> float:
+    """CER of already-normalized texts."""
+    # Handle empty reference
+    if not ref:
+        return 1.0 if hyp else 0.0
+    # Pages that OCR'd cleanly need no DP at all
+    if ref == hyp:
+        return 0.0
+
+    # Calculate Levenshtein distance and normalize
+    return Levenshtein.distance(ref, hyp) / len(ref)
+
+
+def _wer(ref_words: list[str], hyp_words: list[str]) -> float:
+    """WER of already-normalized, already-split texts."""
+    # Handle empty reference
+    if not ref_words:
+        return 1.0 if hyp_words else 0.0
+    if ref_words == hyp_words:
+        return 0.0
+
+    # Calculate Levenshtein distance on word sequences
+    return Levenshtein.distance(ref_words, hyp_words) / len(ref_words)
+
 
 def character_error_rate(
     reference: str, hypothesis: str, normalization: NormalizationType = "strict"
@@ -46,26 +93,8 @@ def character_error_rate(
         - Use 'letters_only' to measure pure character recognition accuracy
         - Empty reference returns 1.0 if hypothesis non-empty, else 0.0
     """
-    # Apply normalization
-    if normalization == "strict":
-        ref = normalize_text_strict(reference)
-        hyp = normalize_text_strict(hypothesis)
-    elif normalization == "standard":
-        ref = normalize_text_standard(reference)
-        hyp = normalize_text_standard(hypothesis)
-    elif normalization == "letters_only":
-        ref = normalize_text_letters_only(reference)
-        hyp = normalize_text_letters_only(hypothesis)
-    else:
-        raise ValueError(f"Unknown normalization: {normalization}")
-
-    # Handle empty reference
-    if not ref:
-        return 1.0 if hyp else 0.0
-
-    # Calculate Levenshtein distance and normalize
-    distance = Levenshtein.distance(ref, hyp)
-    return distance / len(ref)
+    normalize = _get_normalizer(_CER_NORMALIZERS, normalization)
+    return _cer(normalize(reference), normalize(hypothesis))
 
 
 def word_error_rate(
@@ -92,32 +121,239 @@ def word_error_rate(
     Returns:
         Float between 0.0 (perfect) and ∞.
     """
-    # Apply normalization
-    if normalization == "strict":
-        ref = normalize_text_strict(reference)
-        hyp = normalize_text_strict(hypothesis)
-    elif normalization == "standard":
-        ref = normalize_text_standard(reference)
-        hyp = normalize_text_standard(hypothesis)
-    elif normalization == "letters_only":
-        # WER doesn't make sense without word boundaries, use standard by default
-        # TODO Find a more elegant wat to handle this
-        ref = normalize_text_standard(reference)
-        hyp = normalize_text_standard(hypothesis)
-    else:
-        raise ValueError(f"Unknown normalization: {normalization}")
-
-    # Split into words
-    ref_words = ref.split()
-    hyp_words = hyp.split()
+    normalize = _get_normalizer(_WER_NORMALIZERS, normalization)
+    return _wer(normalize(reference).split(), normalize(hypothesis).split())
 
-    # Handle empty reference
-    if not ref_words:
-        return 1.0 if hyp_words else 0.0
 
-    # Calculate Levenshtein distance on word sequences
-    distance = Levenshtein.distance(ref_words, hyp_words)
-    return distance / len(ref_words)
+def _bounded_rate(ref, hyp, max_rate: float) -> Optional[float]:
+    """Error rate of normalized ref/hyp if it is <= max_rate, else None."""
+    if not ref:
+        rate = 1.0 if hyp else 0.0
+        return rate if rate <= max_rate else None
+    if ref == hyp:
+        return 0.0
+    # The length difference is a lower bound on the distance
+    if abs(len(ref) - len(hyp)) / len(ref) > max_rate:
+        return None
+
+    # One above the largest distance the bound allows (the float product
+    # may round down); rapidfuzz abandons the DP once it is exceeded
+    cutoff = int(max_rate * len(ref)) + 1
+    distance = Levenshtein.distance(ref, hyp, score_cutoff=cutoff)
+    if distance > cutoff:
+        return None
+    rate = distance / len(ref)
+    return rate if rate <= max_rate else None
+
+
+def character_error_rate_bounded(
+    reference: str,
+    hypothesis: str,
+    normalization: NormalizationType = "strict",
+    max_cer: float = 0.1,
+) -> Optional[float]:
+    """
+    CER if it does not exceed max_cer, else None.
+
+    For threshold filters ("is this page good enough?"): the edit-distance
+    computation stops as soon as the bound is exceeded, so clearly bad
+    pages cost far less than a full character_error_rate().
+
+    Args:
+        reference: Ground truth text (gold standard)
+        hypothesis: OCR output text to evaluate
+        normalization: Text normalization level (see character_error_rate)
+        max_cer: Largest CER of interest
+
+    Returns:
+        The exact CER when <= max_cer, otherwise None
+    """
+    normalize = _get_normalizer(_CER_NORMALIZERS, normalization)
+    return _bounded_rate(normalize(reference), normalize(hypothesis), max_cer)
+
+
+def word_error_rate_bounded(
+    reference: str,
+    hypothesis: str,
+    normalization: NormalizationType = "strict",
+    max_wer: float = 0.1,
+) -> Optional[float]:
+    """
+    WER if it does not exceed max_wer, else None.
+
+    Word-level counterpart of character_error_rate_bounded().
+
+    Args:
+        reference: Ground truth text (gold standard)
+        hypothesis: OCR output text to evaluate
+        normalization: Text normalization level (see word_error_rate)
+        max_wer: Largest WER of interest
+
+    Returns:
+        The exact WER when <= max_wer, otherwise None
+    """
+    normalize = _get_normalizer(_WER_NORMALIZERS, normalization)
+    return _bounded_rate(normalize(reference).split(), normalize(hypothesis).split(), max_wer)
+
+
+def cer_components(
+    reference: str, hypothesis: str, normalization: NormalizationType = "strict"
+) -> tuple[int, int]:
+    """
+    Character edit distance and reference length, before dividing.
+
+    Summing these over a corpus and dividing once gives the corpus-level
+    CER = sum(distance) / sum(ref_len), which unlike the mean of per-page
+    CERs is not skewed by short pages.
+
+    Args:
+        reference: Ground truth text (gold standard)
+        hypothesis: OCR output text to evaluate
+        normalization: Text normalization level (see character_error_rate)
+
+    Returns:
+        Tuple of (edit_distance, reference_length)
+    """
+    normalize = _get_normalizer(_CER_NORMALIZERS, normalization)
+    ref = normalize(reference)
+    return Levenshtein.distance(ref, normalize(hypothesis)), len(ref)
+
+
+def wer_components(
+    reference: str, hypothesis: str, normalization: NormalizationType = "strict"
+) -> tuple[int, int]:
+    """
+    Word edit distance and reference word count, before dividing.
+
+    Args:
+        reference: Ground truth text (gold standard)
+        hypothesis: OCR output text to evaluate
+        normalization: Text normalization level (see word_error_rate)
+
+    Returns:
+        Tuple of (edit_distance, reference_word_count)
+    """
+    normalize = _get_normalizer(_WER_NORMALIZERS, normalization)
+    ref_words = normalize(reference).split()
+    return Levenshtein.distance(ref_words, normalize(hypothesis).split()), len(ref_words)
+
+
+class CorpusErrorRate:
+    """
+    Streaming corpus-level CER or WER.
+
+    Accumulates integer edit distances and reference lengths across pages;
+    compute() divides once at the end, so each page weighs in proportion
+    to its length.
+
+    Example:
+        >>> corpus_cer = CorpusErrorRate("cer", "standard")
+        >>> for gold, pred in pages:
+        ...     corpus_cer.update(gold, pred)
+        >>> corpus_cer.compute()
+    """
+
+    def __init__(
+        self,
+        metric: Literal["cer", "wer"] = "cer",
+        normalization: NormalizationType = "strict",
+    ):
+        if metric == "cer":
+            self._components = cer_components
+        elif metric == "wer":
+            self._components = wer_components
+        else:
+            raise ValueError(f"Unknown metric: {metric}. Use 'cer' or 'wer'.")
+        # Fail fast on a bad level rather than on the first update()
+        _get_normalizer(_CER_NORMALIZERS, normalization)
+        self.metric = metric
+        self.normalization = normalization
+        self.distance = 0
+        self.ref_length = 0
+
+    def update(self, reference: str, hypothesis: str) -> None:
+        """Add one (reference, hypothesis) pair to the running totals."""
+        distance, ref_length = self._components(reference, hypothesis, self.normalization)
+        self.distance += distance
+        self.ref_length += ref_length
+
+    def compute(self) -> float:
+        """
+        Corpus-level error rate.
+
+        Follows the per-text convention when the total reference length is
+        zero: 1.0 if any hypothesis content was seen, else 0.0.
+        """
+        if not self.ref_length:
+            return 1.0 if self.distance else 0.0
+        return self.distance / self.ref_length
+
+
+def _cpdist_workers(max_workers: Optional[int]) -> int:
+    """Map the max_workers convention (None = all cores) to rapidfuzz's (-1)."""
+    return -1 if max_workers is None else max_workers
+
+
+def cer_array(
+    references: Sequence[str],
+    hypotheses: Sequence[str],
+    normalization: NormalizationType = "strict",
+    max_workers: Optional[int] = 1,
+) -> np.ndarray:
+    """
+    CER for aligned columns of texts (lists, NumPy arrays or pandas Series).
+
+    Replaces df.apply(character_error_rate, ...): distances come from one
+    rapidfuzz.process.cpdist call, which runs the pairwise loop in C++
+    (optionally multi-threaded, with the GIL released), and the division
+    is vectorized.
+
+    Args:
+        references: Ground truth texts
+        hypotheses: OCR output texts, aligned with references
+        normalization: Text normalization level (see character_error_rate)
+        max_workers: Number of cpdist threads (default 1: the calling
+            thread; None uses all cores)
+
+    Returns:
+        float64 array with one CER per pair, equal to character_error_rate()
+    """
+    if len(references) != len(hypotheses):
+        raise ValueError(
+            f"Got {len(references)} references but {len(hypotheses)} hypotheses"
+        )
+    normalize = _get_normalizer(_CER_NORMALIZERS, normalization)
+    refs = [normalize(text) for text in references]
+    hyps = [normalize(text) for text in hypotheses]
+    if not refs:
+        return np.zeros(0)
+
+    distances = process.cpdist(
+        refs, hyps, scorer=Levenshtein.distance, workers=_cpdist_workers(max_workers),
+        dtype=np.int64,
+    )
+    ref_lens = np.fromiter(map(len, refs), dtype=np.int64, count=len(refs))
+    # Empty reference: 1.0 if the hypothesis has content, else 0.0
+    rates = (distances > 0).astype(np.float64)
+    np.divide(distances, ref_lens, out=rates, where=ref_lens > 0)
+    return rates
+
+
+def batch_cer(
+    references: Sequence[str],
+    hypotheses: Sequence[str],
+    normalization: NormalizationType = "strict",
+    max_workers: Optional[int] = 1,
+) -> list[float]:
+    """
+    CER for many aligned (reference, hypothesis) pairs in one call.
+
+    List-returning form of cer_array().
+
+    Returns:
+        One CER per pair, equal to character_error_rate() on that pair
+    """
+    return cer_array(references, hypotheses, normalization, max_workers).tolist()
 
 
 # Convenience function for batch evaluation
@@ -143,11 +379,119 @@ def evaluate_text_quality(
         }
     """
     results = {}
+    # Normalized texts and word splits, keyed by normalizer: each level is
+    # computed once and shared between CER and WER (and letters_only WER
+    # reuses the standard texts)
+    texts = {}
+    words = {}
+
+    def _normalized(normalize):
+        if normalize not in texts:
+            texts[normalize] = (normalize(reference), normalize(hypothesis))
+        return texts[normalize]
 
     for norm in normalizations:
-        cer = character_error_rate(reference, hypothesis, norm)
-        wer = word_error_rate(reference, hypothesis, norm)
+        cer_norm = _get_normalizer(_CER_NORMALIZERS, norm)
+        wer_norm = _WER_NORMALIZERS[norm]
+
+        cer = _cer(*_normalized(cer_norm))
+        if wer_norm not in words:
+            ref, hyp = _normalized(wer_norm)
+            words[wer_norm] = (ref.split(), hyp.split())
+        wer = _wer(*words[wer_norm])
 
         results[norm] = {"cer": cer, "wer": wer}
 
     return results
+
+
+def evaluate_text_quality_batch(
+    references: Sequence[str],
+    hypotheses: Sequence[str],
+    normalizations: list[NormalizationType] = ["strict", "standard", "letters_only"],
+    max_workers: Optional[int] = None,
+) -> list[dict[str, dict[str, float]]]:
+    """
+    Evaluate OCR quality for many (reference, hypothesis) pairs in parallel.
+
+    Pairs are independent, so they are spread over a process pool (the
+    Levenshtein kernel holds the GIL, which rules out threads).
+
+    Args:
+        references: Ground truth texts
+        hypotheses: OCR output texts, aligned with references
+        normalizations: List of normalization levels to evaluate
+        max_workers: Number of worker processes (default: os.cpu_count());
+            1 evaluates in the calling process
+
+    Returns:
+        One evaluate_text_quality() result per pair, in input order
+    """
+    if len(references) != len(hypotheses):
+        raise ValueError(
+            f"Got {len(references)} references but {len(hypotheses)} hypotheses"
+        )
+
+    evaluate = partial(evaluate_text_quality, normalizations=normalizations)
+    return parallel_map(evaluate, references, hypotheses, max_workers=max_workers)
+
+
+def evaluate_corpus_quality(
+    references: Sequence[str],
+    hypotheses: Sequence[str],
+    normalizations: list[NormalizationType] = ["strict", "standard", "letters_only"],
+    max_workers: Optional[int] = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Corpus-level CER and WER at multiple normalization levels.
+
+    Same aggregation as CorpusErrorRate, but every level's distances come
+    from a single rapidfuzz.process.cpdist call, which spreads the pairs
+    over threads with the GIL released (no process pool or pickling).
+
+    Args:
+        references: Ground truth texts
+        hypotheses: OCR output texts, aligned with references
+        normalizations: List of normalization levels to evaluate
+        max_workers: Number of cpdist threads (default: all cores);
+            1 evaluates in the calling thread
+
+    Returns:
+        Dict shaped like evaluate_text_quality(), with corpus-level rates
+    """
+    if len(references) != len(hypotheses):
+        raise ValueError(
+            f"Got {len(references)} references but {len(hypotheses)} hypotheses"
+        )
+
+    def _corpus_rate(refs, hyps) -> float:
+        distance = 0
+        if refs:
+            distances = process.cpdist(
+                refs, hyps, scorer=Levenshtein.distance, workers=_cpdist_workers(max_workers)
+            )
+            distance = int(distances.sum())
+        ref_length = sum(map(len, refs))
+        if not ref_length:
+            return 1.0 if distance else 0.0
+        return distance / ref_length
+
+    results = {}
+    for norm in normalizations:
+        cer_norm = _get_normalizer(_CER_NORMALIZERS, norm)
+        wer_norm = _WER_NORMALIZERS[norm]
+        refs = [cer_norm(text) for text in references]
+        hyps = [cer_norm(text) for text in hypotheses]
+        if wer_norm is not cer_norm:
+            ref_words = [wer_norm(text).split() for text in references]
+            hyp_words = [wer_norm(text).split() for text in hypotheses]
+        else:
+            ref_words = [text.split() for text in refs]
+            hyp_words = [text.split() for text in hyps]
+
+        results[norm] = {
+            "cer": _corpus_rate(refs, hyps),
+            "wer": _corpus_rate(ref_words, hyp_words),
+        }
+
+    return results
@@ -16,15 +16,20 @@ Usage in scripts:
     ensure_data_dirs()
 """
 
+import os
+import re
+from functools import cache, lru_cache
+from itertools import chain, product
 from pathlib import Path
-from typing import Optional, Set, Tuple
+from typing import Iterator, Optional, Set, Tuple
 
+@cache
 def get_project_root() -> Path:
     """
     Find project root by locating pyproject.toml.
 
     Searches upward from this file's location until it finds a directory
-    containing pyproject.toml.
+    containing pyproject.toml. The result is cached for the process.
 
     Returns:
         Path to project root directory
@@ -36,8 +41,8 @@ def get_project_root() -> Path:
     current = Path(__file__).resolve().parent
 
     # Check this directory and all parent directories
-    for parent in [current] + list(current.parents):
-        if (parent / "pyproject.toml").exists():
+    for parent in (current, *current.parents):
+        if os.path.isfile(os.path.join(parent, "pyproject.toml")):
             return parent
 
     raise RuntimeError(
@@ -104,6 +109,21 @@ def ensure_data_dirs() -> None:
 # EVALUATION PATH UTILITIES
 # ============================================================================
 
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\-.]')
+_UNDERSCORE_RUNS_RE = re.compile(r'_+')
+
+
+def _sanitize_name(name: str) -> str:
+    """Sanitize a path component (replace spaces, special chars with underscores)."""
+    # Replace spaces and special chars with underscores
+    sanitized = _UNSAFE_CHARS_RE.sub('_', name)
+    # Remove consecutive underscores
+    sanitized = _UNDERSCORE_RUNS_RE.sub('_', sanitized)
+    # Remove leading/trailing underscores
+    return sanitized.strip('_')
+
+
+@lru_cache(maxsize=1024)
 def build_evaluation_path(
     magazine_name: str,
     model_name: str,
@@ -125,7 +145,8 @@ def build_evaluation_path(
         base_root: Base directory (default: PREDICTIONS / "evaluations")
 
     Returns:
-        Standardized path for extraction results
+        Standardized path for extraction results (memoized process-wide per
+        argument tuple; Path objects are immutable, so sharing is safe)
 
     Example:
         >>> out_root = build_evaluation_path(
@@ -136,30 +157,19 @@ def build_evaluation_path(
         ... )
         >>> # Returns: data/predictions/evaluations/La_Plume/model=pixtral-12b-latest/schema=stage1_page_v2/prompt=detailed_v1
     """
-    import re
-
     if base_root is None:
         base_root = PREDICTIONS / "evaluations"
 
-    # Sanitize names (replace spaces, special chars with underscores)
-    def sanitize(name: str) -> str:
-        # Replace spaces and special chars with underscores
-        sanitized = re.sub(r'[^\w\-.]', '_', name)
-        # Remove consecutive underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
-        # Remove leading/trailing underscores
-        return sanitized.strip('_')
-
-    magazine_clean = sanitize(magazine_name)
-    model_clean = sanitize(model_name)
-    schema_clean = sanitize(schema_name)
+    magazine_clean = _sanitize_name(magazine_name)
+    model_clean = _sanitize_name(model_name)
+    schema_clean = _sanitize_name(schema_name)
 
     # Build path with explicit dimension labels
     path = base_root / magazine_clean / f"model={model_clean}" / f"schema={schema_clean}"
 
     # Add prompt dimension if provided (vision models)
     if prompt_name:
-        prompt_clean = sanitize(prompt_name)
+        prompt_clean = _sanitize_name(prompt_name)
         path = path / f"prompt={prompt_clean}"
     else:
         # OCR models don't use prompts - use special marker
@@ -168,7 +178,56 @@ def build_evaluation_path(
     return path
 
 
-def discover_all_extractions(base_root: Path | None = None) -> list[dict]:
+def _scan_subdirs(path: Path | str, prefix: str = "") -> list[os.DirEntry]:
+    """
+    Subdirectories of path whose name starts with prefix.
+
+    Equivalent to path.glob(f"{prefix}*") restricted to directories
+    (symlinks followed); unreadable directories yield nothing.
+    """
+    try:
+        with os.scandir(path) as it:
+            return [e for e in it if e.name.startswith(prefix) and e.is_dir()]
+    except OSError:
+        return []
+
+
+# Directories never holding source PDFs or extraction outputs; hidden
+# directories (".git", ".ipynb_checkpoints", ...) are skipped as well
+_NOISE_DIRS = frozenset({"__pycache__"})
+
+
+def _is_noise_dir(name: str) -> bool:
+    return name.startswith(".") or name in _NOISE_DIRS
+
+
+def iter_suffix_entries(root: Path | str, suffix: str) -> Iterator[os.DirEntry]:
+    """
+    Yield entries under root whose name ends with suffix, like
+    root.rglob(f"*{suffix}").
+
+    Walks with os.scandir, does not descend into symlinked directories and
+    prunes hidden and cache directories (notebook checkpoints would
+    otherwise be counted as extra pages or magazines).
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name.endswith(suffix):
+                    yield entry
+                if entry.is_dir(follow_symlinks=False) and not _is_noise_dir(entry.name):
+                    stack.append(entry.path)
+
+
+def discover_all_extractions(
+    base_root: Path | None = None,
+    count_files: bool = True
+) -> list[dict]:
     """
     Discover all extraction result directories.
 
@@ -176,6 +235,9 @@ def discover_all_extractions(base_root: Path | None = None) -> list[dict]:
 
     Args:
         base_root: Base evaluation directory (default: PREDICTIONS / "evaluations")
+        count_files: Count each directory's JSON files; if False, stop at the
+            first one (num_files is then None) - much cheaper on large or
+            networked result trees
 
     Returns:
         List of dicts with keys: magazine_name, model_name, schema_name, prompt_name, path, num_files
@@ -194,38 +256,30 @@ def discover_all_extractions(base_root: Path | None = None) -> list[dict]:
     discovered = []
 
     # Find all directories matching: {magazine}/model=*/schema=*/prompt=*
-    for result_dir in base_root.glob("*/model=*/schema=*/prompt=*"):
-        if not result_dir.is_dir():
-            continue
-
-        # Check if results exist (JSON files)
-        json_files = list(result_dir.rglob("*.json"))
-        if not json_files:
+    # (scandir entries carry their type, so no stat() per candidate)
+    result_dirs = (
+        (mag_entry, model_entry, schema_entry, prompt_entry)
+        for mag_entry in _scan_subdirs(base_root)
+        for model_entry in _scan_subdirs(mag_entry.path, "model=")
+        for schema_entry in _scan_subdirs(model_entry.path, "schema=")
+        for prompt_entry in _scan_subdirs(schema_entry.path, "prompt=")
+    )
+    for mag_entry, model_entry, schema_entry, prompt_entry in result_dirs:
+        # Check if results exist (JSON files) without building a list
+        json_files = iter_suffix_entries(prompt_entry.path, ".json")
+        if next(json_files, None) is None:
             continue
-
-        # Parse metadata from path
-        parts = result_dir.parts
-
-        # Find the magazine name
-        magazine_name = None
-        eval_idx = None
-        for i, part in enumerate(parts):
-            if part == "evaluations" and i + 1 < len(parts):
-                magazine_name = parts[i + 1]
-                break
-    
-        model_name = None
-        schema_name = None
-        prompt_name = None
-
-        for part in parts:
-            if part.startswith("model="):
-                model_name = part[6:]
-            elif part.startswith("schema="):
-                schema_name = part[7:]
-            elif part.startswith("prompt="):
-                prompt_value = part[7:]
-                prompt_name = None if prompt_value == "none" else prompt_value
+        num_files = 1 + sum(1 for _ in json_files) if count_files else None
+
+        # Metadata comes straight from the matched segment names: the
+        # magazine is the directory under base_root, and each label
+        # segment is known to start with its "key=" prefix
+        magazine_name = mag_entry.name
+        model_name = model_entry.name[6:]
+        schema_name = schema_entry.name[7:]
+        prompt_value = prompt_entry.name[7:]
+        prompt_name = None if prompt_value == "none" else prompt_value
+        result_dir = Path(prompt_entry.path)
 
         if magazine_name and model_name and schema_name:
             discovered.append({
@@ -234,7 +288,7 @@ def discover_all_extractions(base_root: Path | None = None) -> list[dict]:
                 "schema_name": schema_name,
                 "prompt_name": prompt_name,
                 "path": result_dir,
-                "num_files": len(json_files)
+                "num_files": num_files
             })
 
     # Sort by magazine, then model, schema, prompt for consistency
@@ -273,12 +327,12 @@ def discover_available_magazines(src_root: Path | None = None) -> list[str]:
     if not src_root.exists():
         return []
 
-    # Find all PDF files
-    pdf_files = src_root.rglob("*.pdf")
+    # Find all PDF files (names only; no Path per entry)
+    pdf_entries = iter_suffix_entries(src_root, ".pdf")
 
     # Extract magazine names (stem = filename without extension)
     # Use set to deduplicate (in case of subdirectories with same PDF names)
-    magazines = sorted({pdf.stem for pdf in pdf_files})
+    magazines = sorted({os.path.splitext(entry.name)[0] for entry in pdf_entries})
 
     return magazines
 
@@ -356,29 +410,36 @@ def generate_all_combinations(
         {('La_Plume', 'mistral-ocr-latest', 'stage1_page_v2', None),
          ('La_Plume', 'pixtral-12b-latest', 'stage1_page_v2', 'detailed_v1')}
     """
-    combinations = set()
-
-    for magazine in magazines:
-        for model in models:
-            for schema in schemas:
-                # Check if this is an OCR model
-                is_ocr = 'ocr' in model.lower()
-
-                if is_ocr:
-                    # OCR models: one extraction per schema (no prompts)
-                    combinations.add((magazine, model, schema, None))
-                else:
-                    # Vision models: require prompts
-                    if not prompts:
-                        raise ValueError(
-                            f"Vision model '{model}' requires prompts, but none provided. "
-                            f"Please specify at least one prompt variant."
-                        )
-                    # Test all prompts
-                    for prompt in prompts:
-                        combinations.add((magazine, model, schema, prompt))
-
-    return combinations
+    return set(_iter_combinations(magazines, models, schemas, prompts))
+
+
+def _iter_combinations(
+    magazines: list[str],
+    models: list[str],
+    schemas: list[str],
+    prompts: list[str]
+) -> Iterator[tuple[str, str, str, str | None]]:
+    """
+    Lazy form of generate_all_combinations() (may repeat tuples if the
+    inputs contain duplicates). Validation happens eagerly, at call time.
+    """
+    # Partition once: OCR models get one extraction per schema (no
+    # prompts), vision models one per prompt variant
+    ocr_models = [model for model in models if 'ocr' in model.lower()]
+    vision_models = [model for model in models if 'ocr' not in model.lower()]
+
+    # Vision models: require prompts (only checked when there is something
+    # to combine them with)
+    if vision_models and not prompts and magazines and schemas:
+        raise ValueError(
+            f"Vision model '{vision_models[0]}' requires prompts, but none provided. "
+            f"Please specify at least one prompt variant."
+        )
+
+    return chain(
+        product(magazines, ocr_models, schemas, (None,)),
+        product(magazines, vision_models, schemas, prompts),
+    )
 
 
 def calculate_missing_extractions(
@@ -414,16 +475,50 @@ def calculate_missing_extractions(
         >>> if missing:
         ...     print(f"{len(missing)} extraction(s) missing")
     """
-    # What should exist
-    expected = generate_all_combinations(magazines, models, schemas, prompts)
+    return set(iter_missing_extractions(magazines, models, schemas, prompts, base_root))
+
+
+def iter_missing_extractions(
+    magazines: list[str],
+    models: list[str],
+    schemas: list[str],
+    prompts: list[str],
+    base_root: Path | None = None
+) -> Iterator[tuple[str, str, str, str | None]]:
+    """
+    Yield missing extractions one at a time.
+
+    Same result as calculate_missing_extractions() without building the
+    full expected set first, so callers can start on the first missing
+    combination right away. Each missing tuple is yielded once.
+
+    Args:
+        magazines: List of magazine names
+        models: List of model names
+        schemas: List of schema names
+        prompts: List of prompt names
+        base_root: Base evaluation directory (default: PREDICTIONS / "evaluations")
+
+    Yields:
+        Missing tuples: (magazine_name, model_name, schema_name, prompt_name)
+    """
+    # What should exist (validated now, generated lazily)
+    expected = _iter_combinations(magazines, models, schemas, prompts)
 
     # What does exist
     existing = discover_existing_extractions(base_root)
 
-    # What's missing
-    missing = expected - existing
+    # What's missing (existing grows as tuples are yielded, so duplicate
+    # inputs are not reported twice)
+    return _filter_missing(expected, existing)
 
-    return missing
+
+def _filter_missing(expected, existing: set) -> Iterator[tuple[str, str, str, str | None]]:
+    """Yield combinations not in existing, recording each as it is yielded."""
+    for combination in expected:
+        if combination not in existing:
+            existing.add(combination)
+            yield combination
 
 # Module self-test (runs when imported)
 
@@ -447,7 +542,7 @@ def detect_schema_family(schema_name: str) -> Optional[str]:
     Returns:
         'with_continuations' or 'without_continuations' or None if cannot determine
     """
-    import importlib.util
+    import importlib
     import inspect
 
     # Map schema name to schema file
@@ -457,13 +552,9 @@ def detect_schema_family(schema_name: str) -> Optional[str]:
         return None
 
     try:
-        # Load the schema module dynamically
-        spec = importlib.util.spec_from_file_location(schema_name, schema_file)
-        if spec is None or spec.loader is None:
-            return None
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # Import through the schemas package so relative imports
+        # (e.g. shared field descriptions) resolve
+        module = importlib.import_module(f'schemas.{schema_name}')
 
         # Find the Item class (Stage1Item or similar)
         item_class = None
@@ -4,10 +4,116 @@ Internal module containing helper functions used by multiple providers.
 """
 from __future__ import annotations
 
-import base64
+import binascii
+import threading
+from collections import OrderedDict
 from io import BytesIO
 from pathlib import Path
-from typing import Literal
+from functools import lru_cache
+from typing import Callable, Hashable, Literal
+
+from mistralai import Mistral
+from mistralai.extra import response_format_from_pydantic_model
+from pydantic import BaseModel
+
+# Optional at import time: only vision models need it, and it is resolved
+# once here instead of on every page conversion
+try:
+    from pdf2image import convert_from_path
+except ImportError:
+    convert_from_path = None
+
+
+@lru_cache(maxsize=None)
+def shared_client(api_key: str) -> Mistral:
+    """
+    Return the process-wide Mistral client for an API key.
+    Providers are created per PDF (and per model in comparisons); sharing
+    one client reuses its HTTP connection pool and TLS sessions instead of
+    opening new connections for every provider. The underlying httpx client
+    is safe to use from the concurrent page workers.
+    """
+    return Mistral(api_key=api_key)
+
+
+@lru_cache(maxsize=None)
+def response_format_for(schema_class: type[BaseModel]):
+    """
+    Build the strict response format for a schema once per schema class,
+    instead of walking the model's JSON schema again for every page.
+    The format is only read by the client, so the instance is shared by
+    every provider and PDF using the schema.
+    """
+    return response_format_from_pydantic_model(schema_class)
+
+
+# Read size for streamed base64 encoding (multiple of 3 bytes)
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+
+class BoundedCache:
+    """
+    Thread-safe size-bounded LRU mapping for provider-side caches.
+    A provider may process many documents, so unbounded caches of
+    base64 PDFs and page images grow with every document processed.
+    Args:
+        maxsize: Maximum number of entries kept (least recently used evicted)
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+        # One lock per key being computed, so concurrent misses on the same
+        # key compute it once while other keys stay available
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable) -> str | None:
+        """Return the cached value (marking it recently used) or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: str) -> None:
+        """Insert a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], str]) -> str:
+        """
+        Return the cached value, computing and caching it on a miss.
+        Concurrent callers missing on the same key wait for the first one's
+        result instead of each computing (and holding) their own copy.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                value = self.get(key)
+                if value is None:
+                    value = compute()
+                    self.put(key, value)
+                return value
+        finally:
+            with self._lock:
+                if self._key_locks.get(key) is key_lock:
+                    del self._key_locks[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
 
 
 def encode_file_to_data_url(path: Path, mime: str = "application/pdf") -> str:
@@ -23,15 +129,21 @@ def encode_file_to_data_url(path: Path, mime: str = "application/pdf") -> str:
         >>> pdf_url.startswith("data:application/pdf;base64,")
         True
     """
-    b64 = base64.b64encode(path.read_bytes()).decode("utf-8")
-    return f"data:{mime};base64,{b64}"
+    # Encode in chunks so the raw file is never held in memory alongside its
+    # base64 copy; chunk size is a multiple of 3, so no padding mid-stream
+    buf = bytearray(f"data:{mime};base64,".encode("ascii"))
+    with path.open("rb") as fh:
+        while chunk := fh.read(_B64_CHUNK_SIZE):
+            buf += binascii.b2a_base64(chunk, newline=False)
+    return buf.decode("ascii")
 
 
 def pdf_page_to_base64_image(
     pdf_path: Path,
     page_num: int,  # 1-indexed
-    image_format: Literal["PNG", "JPEG"] = "PNG",
-    dpi: int = 200
+    image_format: Literal["PNG", "JPEG"] = "JPEG",
+    dpi: int = 200,
+    jpeg_quality: int = 85
 ) -> str:
     """
     Convert single PDF page to base64-encoded image.
@@ -41,6 +153,7 @@ def pdf_page_to_base64_image(
         page_num: Page number (1-indexed, first page = 1)
         image_format: Output image format ("PNG" or "JPEG")
         dpi: Resolution for conversion (default: 200)
+        jpeg_quality: JPEG quality when image_format is "JPEG" (default: 85)
     Returns:
         Data URL string in format: data:image/<format>;base64,<encoded>
     Raises:
@@ -48,19 +161,17 @@ def pdf_page_to_base64_image(
         RuntimeError: If PDF conversion fails
     Example:
         >>> img_url = pdf_page_to_base64_image(Path("doc.pdf"), page_num=1)
-        >>> img_url.startswith("data:image/png;base64,")
+        >>> img_url.startswith("data:image/jpeg;base64,")
         True
     Note:
         Requires pdf2image package and poppler system library.
         Install: pip install pdf2image
     """
-    try:
-        from pdf2image import convert_from_path
-    except ImportError as e:
+    if convert_from_path is None:
         raise ImportError(
             "pdf2image is required for vision models. "
             "Install with: pip install pdf2image"
-        ) from e
+        )
 
     try:
         # Convert single page to image
@@ -74,17 +185,80 @@ def pdf_page_to_base64_image(
         if not images:
             raise RuntimeError(f"No image generated for page {page_num}")
 
-        # Encode image to base64
-        buffer = BytesIO()
-        images[0].save(buffer, format=image_format)
-        b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
+        return _image_to_data_url(images[0], image_format, jpeg_quality)
 
-        # Determine MIME type
-        mime = f"image/{image_format.lower()}"
+    except Exception as e:
+        raise RuntimeError(
+            f"Failed to convert PDF page {page_num} to image: {e}"
+        ) from e
 
-        return f"data:{mime};base64,{b64}"
+
+def pdf_pages_to_base64_images(
+    pdf_path: Path,
+    first_page: int,  # 1-indexed
+    last_page: int,  # 1-indexed, inclusive
+    image_format: Literal["PNG", "JPEG"] = "JPEG",
+    dpi: int = 200,
+    jpeg_quality: int = 85,
+    thread_count: int = 1
+) -> dict[int, str]:
+    """
+    Convert a contiguous range of PDF pages to base64-encoded images.
+    Renders the whole range with one poppler invocation instead of one
+    per page; otherwise identical to pdf_page_to_base64_image().
+    Args:
+        pdf_path: Path to PDF file
+        first_page: First page to convert (1-indexed)
+        last_page: Last page to convert (1-indexed, inclusive)
+        image_format: Output image format ("PNG" or "JPEG")
+        dpi: Resolution for conversion (default: 200)
+        jpeg_quality: JPEG quality when image_format is "JPEG" (default: 85)
+        thread_count: Poppler processes to split the range across (default: 1)
+    Returns:
+        Dict mapping page number to data URL
+    Raises:
+        ImportError: If pdf2image package not installed
+        RuntimeError: If PDF conversion fails
+    """
+    if convert_from_path is None:
+        raise ImportError(
+            "pdf2image is required for vision models. "
+            "Install with: pip install pdf2image"
+        )
+
+    try:
+        images = convert_from_path(
+            pdf_path,
+            first_page=first_page,
+            last_page=last_page,
+            dpi=dpi,
+            thread_count=thread_count
+        )
+        return {
+            page_num: _image_to_data_url(image, image_format, jpeg_quality)
+            for page_num, image in zip(range(first_page, last_page + 1), images)
+        }
 
     except Exception as e:
         raise RuntimeError(
-            f"Failed to convert PDF page {page_num} to image: {e}"
-        ) from e
\ No newline at end of file
+            f"Failed to convert PDF pages {first_page}-{last_page} to images: {e}"
+        ) from e
+
+
+def _image_to_data_url(image, image_format: str, jpeg_quality: int = 85) -> str:
+    """Encode a PIL image as a base64 data URL."""
+    buffer = BytesIO()
+    if image_format.upper() == "JPEG":
+        # A 200-DPI page is several MB as PNG but well under 1 MB as JPEG,
+        # which is what gets base64-encoded, cached and uploaded
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(buffer, format=image_format, quality=jpeg_quality)
+    else:
+        image.save(buffer, format=image_format)
+    b64 = binascii.b2a_base64(buffer.getvalue(), newline=False).decode("ascii")
+
+    # Determine MIME type
+    mime = f"image/{image_format.lower()}"
+
+    return f"data:{mime};base64,{b64}"
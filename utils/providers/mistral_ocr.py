@@ -8,10 +8,13 @@ import json
 import logging
 from pathlib import Path
 from pydantic import BaseModel
-from mistralai import Mistral
-from mistralai.extra import response_format_from_pydantic_model
 
-from ._shared import encode_file_to_data_url
+from ._shared import (
+    BoundedCache,
+    encode_file_to_data_url,
+    response_format_for,
+    shared_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,16 +26,22 @@ class MistralOCRProvider:
     Optimized for document extraction with native PDF support.
     """
 
-    def __init__(self, api_key: str, model_name: str = "mistral-ocr-latest"):
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "mistral-ocr-latest",
+        pdf_cache_size: int = 4
+    ):
         """
         Initialize Mistral OCR provider.
         Args:
             api_key: Mistral API key
             model_name: Model identifier (default: "mistral-ocr-latest")
+            pdf_cache_size: Encoded PDFs kept in memory (default: 4)
         """
-        self.client = Mistral(api_key=api_key)
+        self.client = shared_client(api_key)
         self.model_name = model_name
-        self._pdf_cache: dict[Path, str] = {}
+        self._pdf_cache = BoundedCache(pdf_cache_size)
 
     def process_page(
         self,
@@ -51,15 +60,18 @@ class MistralOCRProvider:
         Returns:
             Extracted data dict with at least {"items": [...]}
         """
-        # Cache encoded PDF (only encode once per document)
-        if pdf_path not in self._pdf_cache:
-            self._pdf_cache[pdf_path] = encode_file_to_data_url(pdf_path)
+        # Cache encoded PDF (only encode once per document); keyed on mtime
+        # too, so a PDF replaced mid-sweep is re-encoded instead of served stale.
+        # Concurrent pages of one PDF share a single encode
+        cache_key = (pdf_path, pdf_path.stat().st_mtime_ns)
+        data_url = self._pdf_cache.get_or_compute(
+            cache_key, lambda: encode_file_to_data_url(pdf_path)
+        )
 
-        data_url = self._pdf_cache[pdf_path]
         page_idx = page_num - 1  # Convert to 0-indexed
 
         # Generate response format from schema
-        doc_annot_fmt = response_format_from_pydantic_model(schema_class)
+        doc_annot_fmt = response_format_for(schema_class)
 
         # Call OCR API
         resp = self.client.ocr.process(
@@ -9,14 +9,37 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from pydantic import BaseModel, ValidationError
-from mistralai import Mistral
 
-from ._shared import pdf_page_to_base64_image
+from ._shared import (
+    BoundedCache,
+    pdf_page_to_base64_image,
+    pdf_pages_to_base64_images,
+    shared_client,
+)
 
 logger = logging.getLogger(__name__)
 
+# Pages rendered per poppler call when prefetching; bounds how many
+# decoded page bitmaps are held in memory at once
+_PREFETCH_BATCH = 8
+# Pages kept rendered (or in flight) ahead of the page being extracted;
+# prefetched images are held here until consumed, on top of the image cache
+_PREFETCH_AHEAD = 2 * _PREFETCH_BATCH
+
+
+def _image_key(pdf_path: Path, page_num: int, render_opts: dict) -> tuple:
+    """Image cache key; includes the render settings, so changing dpi or
+    format between calls never returns a stale image."""
+    return (
+        pdf_path, page_num,
+        render_opts["dpi"], render_opts["image_format"], render_opts["jpeg_quality"],
+    )
+
 
 class MistralVisionProvider:
     """
@@ -32,17 +55,149 @@ class MistralVisionProvider:
     - mistral-small-2506: Cost-effective, high volume
     """
 
-    def __init__(self, api_key: str, model_name: str):
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str,
+        image_cache_size: int = 32,
+        render_processes: int | None = None
+    ):
         """
         Initialize Mistral Vision provider.
         Args:
             api_key: Mistral API key
             model_name: Model identifier (e.g., "pixtral-12b-latest")
+            image_cache_size: Page images kept after use, for retries (default:
+                32); up to _PREFETCH_AHEAD prefetched pages are held on top
+            render_processes: Poppler processes per prefetched batch
+                (default: up to 4, bounded by the CPU count)
         """
-        self.client = Mistral(api_key=api_key)
+        self.client = shared_client(api_key)
         self.model_name = model_name
         # Cache images to avoid re-converting same page
-        self._image_cache: dict[tuple[Path, int], str] = {}
+        self._image_cache = BoundedCache(image_cache_size)
+        # Background page rendering: poppler runs while API calls are in flight
+        self._render_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="page-render"
+        )
+        # Each prefetched batch is split across this many pdftoppm processes
+        self._render_processes = render_processes or min(4, os.cpu_count() or 1)
+        self._render_lock = threading.Lock()
+        # Submitted but not yet consumed renders (with their render settings),
+        # and pages still to submit
+        self._pending: dict[tuple[Path, int], tuple[Future, dict]] = {}
+        self._plan: dict[Path, tuple[list[int], dict]] = {}
+        self._closed = False
+
+    def prefetch_pages(
+        self,
+        pdf_path: Path,
+        page_nums: list[int],  # 1-indexed
+        dpi: int = 200,
+        image_format: str = "JPEG",
+        jpeg_quality: int = 85
+    ) -> None:
+        """
+        Start rendering the given pages in the background, ahead of process_page().
+        Contiguous runs of uncached pages are rendered in batches of up to
+        _PREFETCH_BATCH pages per poppler call, instead of one process
+        spawn and PDF parse per page. Only a window of _PREFETCH_AHEAD pages is
+        kept ahead; process_page() tops it up as pages are consumed.
+        Args:
+            pdf_path: Path to PDF file
+            page_nums: Page numbers to render (1-indexed)
+            dpi: Image resolution (must match the dpi used by process_page)
+            image_format: Image format ("JPEG" or "PNG", as for process_page)
+            jpeg_quality: JPEG quality (as for process_page)
+        """
+        render_opts = {"image_format": image_format, "dpi": dpi, "jpeg_quality": jpeg_quality}
+        pending = sorted({
+            p for p in page_nums
+            if _image_key(pdf_path, p, render_opts) not in self._image_cache
+        })
+        with self._render_lock:
+            if self._closed:
+                return
+            self._plan[pdf_path] = (pending, render_opts)
+            self._fill_window(pdf_path)
+
+    def _fill_window(self, pdf_path: Path) -> None:
+        """Submit planned batches until the lookahead window is full (lock held)."""
+        pages, render_opts = self._plan.get(pdf_path, ([], {}))
+        in_flight = sum(1 for key in self._pending if key[0] == pdf_path)
+        # Top up only once a whole batch fits, so steady state keeps
+        # rendering full batches instead of one page per consumed page
+        while pages and _PREFETCH_AHEAD - in_flight >= min(_PREFETCH_BATCH, len(pages)):
+            # Extend the batch while pages stay contiguous, never past the
+            # room left in the window
+            limit = min(_PREFETCH_BATCH, _PREFETCH_AHEAD - in_flight)
+            end = 1
+            while (end < len(pages) and end < limit
+                   and pages[end] == pages[end - 1] + 1):
+                end += 1
+            batch, pages[:] = pages[:end], pages[end:]
+            future = self._render_executor.submit(
+                self._render_batch, pdf_path, batch[0], batch[-1], render_opts
+            )
+            for page_num in batch:
+                self._pending[(pdf_path, page_num)] = (future, render_opts)
+            in_flight += len(batch)
+        if not pages:
+            self._plan.pop(pdf_path, None)
+
+    def _render_batch(
+        self, pdf_path: Path, first: int, last: int, render_opts: dict
+    ) -> dict[int, str]:
+        """Render a page range (runs on the render thread)."""
+        logger.debug(f"Converting pages {first}-{last} of {pdf_path.name} to images")
+        return pdf_pages_to_base64_images(
+            pdf_path, first, last, thread_count=self._render_processes, **render_opts
+        )
+
+    def _get_page_image(self, pdf_path: Path, page_num: int, **kwargs) -> str:
+        """Return the page image, waiting on a prefetch or rendering inline."""
+        render_opts = {
+            "image_format": kwargs.get("image_format", "JPEG"),
+            "dpi": kwargs.get("dpi", 200),
+            "jpeg_quality": kwargs.get("jpeg_quality", 85),
+        }
+        with self._render_lock:
+            pending = self._pending.pop((pdf_path, page_num), None)
+            self._fill_window(pdf_path)
+
+        cache_key = _image_key(pdf_path, page_num, render_opts)
+        # Prefetched images live on their future until consumed, so the LRU
+        # (which favours pages just used) cannot evict them before use
+        if pending is not None and pending[1] == render_opts:
+            try:
+                image_url = pending[0].result()[page_num]
+            except Exception as e:
+                logger.debug(f"Prefetch of page {page_num} failed, rendering inline: {e}")
+            else:
+                self._image_cache.put(cache_key, image_url)
+                return image_url
+
+        # A prefetch rendered with other settings is a cache miss here
+        def _render() -> str:
+            logger.debug(f"Converting page {page_num} of {pdf_path.name} to image")
+            return pdf_page_to_base64_image(pdf_path, page_num, **render_opts)
+
+        return self._image_cache.get_or_compute(cache_key, _render)
+
+    def close(self) -> None:
+        """
+        Drop prefetch state and stop the render thread.
+        Queued renders for pages that were never consumed are cancelled.
+        Safe to call more than once; afterwards prefetch_pages() is a no-op
+        and pages are rendered inline.
+        """
+        with self._render_lock:
+            self._closed = True
+            for future, _ in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._plan.clear()
+        self._render_executor.shutdown(wait=False, cancel_futures=True)
 
     def process_page(
         self,
@@ -54,7 +209,8 @@ class MistralVisionProvider:
     ) -> dict:
         """
         Extract structured data from PDF page using vision model.
-        Uses JSON mode with manual validation for better error recovery.
+        Uses the SDK-validated result, with manual validation as a fallback
+        for better error recovery.
         This method combines vision and structured output capabilities:
         1. Converts PDF page to base64 image (vision input)
         2. Calls chat.parse() with Pydantic schema (structured output)
@@ -67,6 +223,8 @@ class MistralVisionProvider:
             **kwargs: Additional options:
                 - user_prompt: Optional user message (default: "Extract the data.")
                 - dpi: Image resolution for PDF conversion (default: 200)
+                - image_format: "JPEG" or "PNG" page image (default: "JPEG")
+                - jpeg_quality: JPEG quality (default: 85)
                 - temperature: API temperature (default: 0)
                 - max_tokens: Response limit (default: 8192)
         Returns:
@@ -76,17 +234,8 @@ class MistralVisionProvider:
             ImportError: If pdf2image not installed
             RuntimeError: If PDF conversion or API call fails
         """
-        # Convert PDF page to image (with caching)
-        cache_key = (pdf_path, page_num)
-        if cache_key not in self._image_cache:
-            logger.debug(f"Converting page {page_num} of {pdf_path.name} to image")
-            self._image_cache[cache_key] = pdf_page_to_base64_image(
-                pdf_path,
-                page_num,
-                dpi=kwargs.get("dpi", 200)
-            )
-
-        image_url = self._image_cache[cache_key]
+        # Convert PDF page to image (with caching and background prefetch)
+        image_url = self._get_page_image(pdf_path, page_num, **kwargs)
 
         # Get user prompt (optional)
         user_prompt = kwargs.get("user_prompt", "Extract and structure the text from the following magazine page, Your output should be an instance of a JSON object following the schema provided.")
@@ -127,16 +276,31 @@ class MistralVisionProvider:
                 f"Failed to extract data from page {page_num} using {self.model_name}: {e}"
             ) from e
         
+        # chat.parse() has already validated the content against schema_class
+        parsed = getattr(resp.choices[0].message, "parsed", None)
+        if isinstance(parsed, schema_class):
+            logger.debug(f"Using SDK-validated result for page {page_num}")
+            return parsed.model_dump()
+
         # Extract raw JSON string
         raw_content = resp.choices[0].message.content
 
         # Log raw content length for debugging
         logger.debug(f"Received {len(raw_content)} characters of JSON content for page {page_num}")
 
-        # Parse JSON manually
+        # Parse and validate in one pass inside pydantic-core
+        try:
+            validated = schema_class.model_validate_json(raw_content)
+            logger.debug(f"Successfully validated against schema for page {page_num}")
+            return validated.model_dump()
+
+        except ValidationError as e:
+            validation_error = e
+
+        # Failure path only: re-parse with the stdlib decoder, which reports
+        # the exact location of malformed JSON
         try:
             result_dict = json.loads(raw_content)
-            logger.debug(f"Parsed JSON successfully for page {page_num}")
         
         except json.JSONDecodeError as e:
             # JSON parsing failed - log details for debugging
@@ -166,24 +330,16 @@ class MistralVisionProvider:
                 f"Check {error_file} for full content."
             ) from e
     
-        # Validate against Pydantic schema
-        try:
-            validated = schema_class(**result_dict)
-            logger.debug(f"Successfully validated against schema for page {page_num}")
-            
-        except ValidationError as e:
-            # Schema validation failed - log details
-            logger.error(f"Schema validation failed for page {page_num}: {e}")
-            logger.error(f"Validation errors: {e.errors()}")
-            
-            # Log the parsed dict structure
+        # JSON is well formed, so the schema validation failed - log details
+        logger.error(f"Schema validation failed for page {page_num}: {validation_error}")
+        logger.error(f"Validation errors: {validation_error.errors()}")
+        
+        # Log the parsed dict structure
+        if isinstance(result_dict, dict):
             logger.debug(f"Parsed dict keys: {result_dict.keys()}")
             if "items" in result_dict:
                 logger.debug(f"Number of items: {len(result_dict['items'])}")
-            
-            raise RuntimeError(
-                f"Data from page {page_num} does not match expected schema: {e}"
-            ) from e
         
-        # Return as dict
-        return validated.model_dump()
\ No newline at end of file
+        raise RuntimeError(
+            f"Data from page {page_num} does not match expected schema: {validation_error}"
+        ) from validation_error